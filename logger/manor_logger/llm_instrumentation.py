@@ -4,10 +4,11 @@ LLM instrumentation helpers for Datadog APM.
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import os
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 try:
     from ddtrace import tracer
@@ -19,21 +20,132 @@ except ImportError:
 
 from .direct_logger import log_datadog
 
+# Resolved once so the wrappers test a single global per call
+_TRACE = DDTRACE_AVAILABLE and tracer is not None
+
+# APM service name for LLM spans, read once at import
+LLM_DD_SERVICE = os.getenv("LLM_DD_SERVICE", os.getenv("DD_SERVICE", "llm"))
+
 
 class InstrumentationConfig:
-    def __init__(self, enabled_types: set[str] | None = None) -> None:
+    def __init__(self, enabled_types: Iterable[str] | None = None) -> None:
         if enabled_types is None:
             raw = os.getenv("LLM_INSTRUMENTATION_TYPES", "llm,pipeline")
             enabled_types = {item.strip() for item in raw.split(",") if item.strip()}
-        self.enabled_types = enabled_types
+        self.enabled_types = frozenset(enabled_types)
+        self._wildcard = "*" in self.enabled_types
 
     def is_enabled(self, instrumentation_type: str) -> bool:
-        return "*" in self.enabled_types or instrumentation_type in self.enabled_types
+        return self._wildcard or instrumentation_type in self.enabled_types
 
 
 DEFAULT_INSTRUMENTATION = InstrumentationConfig()
 
 
+def _elapsed_ms(start_time: int) -> float:
+    return (time.perf_counter_ns() - start_time) / 1_000_000
+
+
+def _start_llm_span(span: Any, operation_name: str, kwargs: dict) -> Any:
+    model = kwargs.get("model") or getattr(kwargs.get("lm"), "model", "unknown")
+    span.set_tags({
+        "span.kind": "llm",
+        "llm.operation": operation_name,
+        "llm.model": model,
+    })
+    return model
+
+
+def _finish_llm_call(
+    span: Any,
+    operation_name: str,
+    model: Any,
+    start_time: int,
+    result: Any = None,
+    error: Exception | None = None,
+) -> None:
+    """
+    Tag the span and log the outcome of an LLM call. span is None when
+    tracing is unavailable, in which case only the duration is logged.
+    """
+    duration_ms = _elapsed_ms(start_time)
+    if span is None:
+        log_datadog("llm_call", operation=operation_name, duration_ms=duration_ms)
+        return
+
+    if error is not None:
+        error_type = type(error).__name__
+        error_message = str(error)
+        span.set_tags({
+            "error": True,
+            "error.type": error_type,
+            "error.message": error_message,
+            "llm.duration_ms": duration_ms,
+        })
+        log_datadog(
+            "llm_call_failed",
+            level="error",
+            operation=operation_name,
+            duration_ms=duration_ms,
+            error_type=error_type,
+            error_message=error_message,
+        )
+        return
+
+    token_usage = extract_token_usage(result)
+    if token_usage:
+        span.set_tags({
+            "llm.prompt_tokens": token_usage.get("prompt_tokens", 0),
+            "llm.completion_tokens": token_usage.get("completion_tokens", 0),
+            "llm.total_tokens": token_usage.get("total_tokens", 0),
+            "llm.duration_ms": duration_ms,
+        })
+    else:
+        span.set_tag("llm.duration_ms", duration_ms)
+    log_datadog(
+        "llm_call",
+        operation=operation_name,
+        model=model,
+        duration_ms=duration_ms,
+        **token_usage if token_usage else {},
+    )
+
+
+def _finish_pipeline(
+    span: Any,
+    pipeline_name: str,
+    start_time: int,
+    error: Exception | None = None,
+) -> None:
+    """
+    Tag the span and log the outcome of a pipeline run. span is None when
+    tracing is unavailable.
+    """
+    duration_ms = _elapsed_ms(start_time)
+    if error is not None:
+        error_type = type(error).__name__
+        if span is not None:
+            span.set_tags({
+                "error": True,
+                "error.type": error_type,
+                "error.message": str(error),
+                "pipeline.duration_ms": duration_ms,
+                "pipeline.success": False,
+            })
+        log_datadog(
+            "llm_pipeline_failed",
+            level="error",
+            pipeline=pipeline_name,
+            duration_ms=duration_ms,
+            error_type=error_type,
+        )
+        return
+
+    if span is not None:
+        span.set_tags({"pipeline.duration_ms": duration_ms, "pipeline.success": True})
+    log_datadog("llm_pipeline_completed", pipeline=pipeline_name, duration_ms=duration_ms)
+
+
 def instrument_llm_call(
     operation_name: str = "llm.call",
     instrumentation_type: str = "llm",
@@ -41,137 +153,57 @@ def instrument_llm_call(
 ):
     """
     Decorator to instrument LLM calls with Datadog APM tracing.
+
+    The enabled check runs at decoration time: a disabled type returns the
+    function undecorated.
     """
     config = config or DEFAULT_INSTRUMENTATION
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            if not config.is_enabled(instrumentation_type):
-                return await func(*args, **kwargs)
+        if not config.is_enabled(instrumentation_type):
+            return func
 
-            start_time = time.monotonic()
-            llm_service = os.getenv("LLM_DD_SERVICE", os.getenv("DD_SERVICE", "llm"))
-            if DDTRACE_AVAILABLE and tracer:
-                with tracer.trace(operation_name, service=llm_service) as span:
-                    span.set_tag("span.kind", "llm")
-                    span.set_tag("llm.operation", operation_name)
+        llm_service = LLM_DD_SERVICE
 
-                    model = kwargs.get("model") or getattr(kwargs.get("lm"), "model", "unknown")
-                    span.set_tag("llm.model", model)
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.perf_counter_ns()
+                if not _TRACE:
+                    result = await func(*args, **kwargs)
+                    _finish_llm_call(None, operation_name, None, start_time)
+                    return result
 
+                with tracer.trace(operation_name, service=llm_service) as span:
+                    model = _start_llm_span(span, operation_name, kwargs)
                     try:
                         result = await func(*args, **kwargs)
-                        token_usage = extract_token_usage(result)
-                        if token_usage:
-                            span.set_tag("llm.prompt_tokens", token_usage.get("prompt_tokens", 0))
-                            span.set_tag(
-                                "llm.completion_tokens", token_usage.get("completion_tokens", 0)
-                            )
-                            span.set_tag("llm.total_tokens", token_usage.get("total_tokens", 0))
-
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("llm.duration_ms", duration_ms)
-
-                        log_datadog(
-                            "llm_call",
-                            operation=operation_name,
-                            model=model,
-                            duration_ms=duration_ms,
-                            **token_usage if token_usage else {},
-                        )
-
-                        return result
                     except Exception as e:
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("error", True)
-                        span.set_tag("error.type", type(e).__name__)
-                        span.set_tag("error.message", str(e))
-                        span.set_tag("llm.duration_ms", duration_ms)
-
-                        log_datadog(
-                            "llm_call_failed",
-                            level="error",
-                            operation=operation_name,
-                            duration_ms=duration_ms,
-                            error_type=type(e).__name__,
-                            error_message=str(e),
-                        )
+                        _finish_llm_call(span, operation_name, model, start_time, error=e)
                         raise
+                    _finish_llm_call(span, operation_name, model, start_time, result)
+                    return result
 
-            result = await func(*args, **kwargs)
-            duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-            log_datadog(
-                "llm_call",
-                operation=operation_name,
-                duration_ms=duration_ms,
-            )
-            return result
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            if not config.is_enabled(instrumentation_type):
-                return func(*args, **kwargs)
-
-            start_time = time.monotonic()
-            llm_service = os.getenv("LLM_DD_SERVICE", os.getenv("DD_SERVICE", "llm"))
-            if DDTRACE_AVAILABLE and tracer:
-                with tracer.trace(operation_name, service=llm_service) as span:
-                    span.set_tag("span.kind", "llm")
-                    span.set_tag("llm.operation", operation_name)
-
-                    model = kwargs.get("model") or getattr(kwargs.get("lm"), "model", "unknown")
-                    span.set_tag("llm.model", model)
-
-                    try:
-                        result = func(*args, **kwargs)
-                        token_usage = extract_token_usage(result)
-                        if token_usage:
-                            span.set_tag("llm.prompt_tokens", token_usage.get("prompt_tokens", 0))
-                            span.set_tag(
-                                "llm.completion_tokens", token_usage.get("completion_tokens", 0)
-                            )
-                            span.set_tag("llm.total_tokens", token_usage.get("total_tokens", 0))
-
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("llm.duration_ms", duration_ms)
-
-                        log_datadog(
-                            "llm_call",
-                            operation=operation_name,
-                            model=model,
-                            duration_ms=duration_ms,
-                            **token_usage if token_usage else {},
-                        )
-                        return result
-                    except Exception as e:
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("error", True)
-                        span.set_tag("error.type", type(e).__name__)
-                        span.set_tag("error.message", str(e))
-
-                        log_datadog(
-                            "llm_call_failed",
-                            level="error",
-                            operation=operation_name,
-                            duration_ms=duration_ms,
-                            error_type=type(e).__name__,
-                        )
-                        raise
-
-            result = func(*args, **kwargs)
-            duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-            log_datadog(
-                "llm_call",
-                operation=operation_name,
-                duration_ms=duration_ms,
-            )
-            return result
-
-        import asyncio
+            start_time = time.perf_counter_ns()
+            if not _TRACE:
+                result = func(*args, **kwargs)
+                _finish_llm_call(None, operation_name, None, start_time)
+                return result
+
+            with tracer.trace(operation_name, service=llm_service) as span:
+                model = _start_llm_span(span, operation_name, kwargs)
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    _finish_llm_call(span, operation_name, model, start_time, error=e)
+                    raise
+                _finish_llm_call(span, operation_name, model, start_time, result)
+                return result
 
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
@@ -181,26 +213,28 @@ def extract_token_usage(result: Any) -> dict | None:
     if not result:
         return None
 
-    token_usage: dict[str, Any] = {}
-
-    if hasattr(result, "usage") and result.usage:
-        usage = result.usage
-        token_usage = {
+    # litellm/OpenAI response objects: by far the common case
+    usage = getattr(result, "usage", None)
+    if usage:
+        return {
             "prompt_tokens": getattr(usage, "prompt_tokens", 0),
             "completion_tokens": getattr(usage, "completion_tokens", 0),
             "total_tokens": getattr(usage, "total_tokens", 0),
         }
-    elif isinstance(result, dict) and "usage" in result:
-        usage = result["usage"]
-        token_usage = {
-            "prompt_tokens": usage.get("prompt_tokens", 0),
-            "completion_tokens": usage.get("completion_tokens", 0),
-            "total_tokens": usage.get("total_tokens", 0),
-        }
-    elif hasattr(result, "_hidden_params") and hasattr(result._hidden_params, "response_cost"):
-        token_usage["cost"] = result._hidden_params.response_cost
 
-    return token_usage if token_usage else None
+    if isinstance(result, dict):
+        usage = result.get("usage")
+        if usage:
+            return {
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            }
+        return None
+
+    hidden_params = getattr(result, "_hidden_params", None)
+    cost = getattr(hidden_params, "response_cost", None)
+    return {"cost": cost} if cost is not None else None
 
 
 def trace_llm_pipeline(
@@ -210,118 +244,58 @@ def trace_llm_pipeline(
 ):
     """
     Decorator to trace entire LLM pipelines.
+
+    The enabled check runs at decoration time: a disabled type returns the
+    function undecorated.
     """
     config = config or DEFAULT_INSTRUMENTATION
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            if not config.is_enabled(instrumentation_type):
-                return await func(*args, **kwargs)
-
-            start_time = time.monotonic()
+        if not config.is_enabled(instrumentation_type):
+            return func
 
-            llm_service = os.getenv("LLM_DD_SERVICE", os.getenv("DD_SERVICE", "llm"))
-            if DDTRACE_AVAILABLE and tracer:
-                with tracer.trace(f"llm.pipeline.{pipeline_name}", service=llm_service) as span:
-                    span.set_tag("span.kind", "pipeline")
-                    span.set_tag("pipeline.name", pipeline_name)
+        llm_service = LLM_DD_SERVICE
+        span_name = f"llm.pipeline.{pipeline_name}"
 
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.perf_counter_ns()
+                if not _TRACE:
+                    result = await func(*args, **kwargs)
+                    _finish_pipeline(None, pipeline_name, start_time)
+                    return result
+
+                with tracer.trace(span_name, service=llm_service) as span:
+                    span.set_tags({"span.kind": "pipeline", "pipeline.name": pipeline_name})
                     try:
                         result = await func(*args, **kwargs)
-
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("pipeline.duration_ms", duration_ms)
-                        span.set_tag("pipeline.success", True)
-
-                        log_datadog(
-                            "llm_pipeline_completed",
-                            pipeline=pipeline_name,
-                            duration_ms=duration_ms,
-                        )
-
-                        return result
                     except Exception as e:
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("error", True)
-                        span.set_tag("error.type", type(e).__name__)
-                        span.set_tag("error.message", str(e))
-                        span.set_tag("pipeline.duration_ms", duration_ms)
-                        span.set_tag("pipeline.success", False)
-
-                        log_datadog(
-                            "llm_pipeline_failed",
-                            level="error",
-                            pipeline=pipeline_name,
-                            duration_ms=duration_ms,
-                            error_type=type(e).__name__,
-                        )
+                        _finish_pipeline(span, pipeline_name, start_time, error=e)
                         raise
+                    _finish_pipeline(span, pipeline_name, start_time)
+                    return result
 
-            result = await func(*args, **kwargs)
-            duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-            log_datadog(
-                "llm_pipeline_completed",
-                pipeline=pipeline_name,
-                duration_ms=duration_ms,
-            )
-            return result
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            if not config.is_enabled(instrumentation_type):
-                return func(*args, **kwargs)
+            start_time = time.perf_counter_ns()
+            if not _TRACE:
+                result = func(*args, **kwargs)
+                _finish_pipeline(None, pipeline_name, start_time)
+                return result
+
+            with tracer.trace(span_name, service=llm_service) as span:
+                span.set_tags({"span.kind": "pipeline", "pipeline.name": pipeline_name})
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    _finish_pipeline(span, pipeline_name, start_time, error=e)
+                    raise
+                _finish_pipeline(span, pipeline_name, start_time)
+                return result
 
-            start_time = time.monotonic()
-
-            llm_service = os.getenv("LLM_DD_SERVICE", os.getenv("DD_SERVICE", "llm"))
-            if DDTRACE_AVAILABLE and tracer:
-                with tracer.trace(f"llm.pipeline.{pipeline_name}", service=llm_service) as span:
-                    span.set_tag("span.kind", "pipeline")
-                    span.set_tag("pipeline.name", pipeline_name)
-
-                    try:
-                        result = func(*args, **kwargs)
-
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("pipeline.duration_ms", duration_ms)
-                        span.set_tag("pipeline.success", True)
-
-                        log_datadog(
-                            "llm_pipeline_completed",
-                            pipeline=pipeline_name,
-                            duration_ms=duration_ms,
-                        )
-
-                        return result
-                    except Exception as e:
-                        duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-                        span.set_tag("error", True)
-                        span.set_tag("error.type", type(e).__name__)
-                        span.set_tag("error.message", str(e))
-
-                        log_datadog(
-                            "llm_pipeline_failed",
-                            level="error",
-                            pipeline=pipeline_name,
-                            duration_ms=duration_ms,
-                            error_type=type(e).__name__,
-                        )
-                        raise
-
-            result = func(*args, **kwargs)
-            duration_ms = round((time.monotonic() - start_time) * 1000, 2)
-            log_datadog(
-                "llm_pipeline_completed",
-                pipeline=pipeline_name,
-                duration_ms=duration_ms,
-            )
-            return result
-
-        import asyncio
-
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
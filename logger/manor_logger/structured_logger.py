@@ -5,25 +5,22 @@ Structured logging configuration with Datadog integration.
 from __future__ import annotations
 
 import atexit
+import gzip
 import json
 import logging
 import os
 import sys
 import threading
 import time
+from collections import deque
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
+from queue import Empty, Full, Queue
 from typing import Any, Dict, List
 
+import orjson
 import structlog
 
-try:
-    from ddtrace import tracer
-
-    DDTRACE_AVAILABLE = True
-except ImportError:
-    tracer = None
-    DDTRACE_AVAILABLE = False
+from .trace_context import DDTRACE_AVAILABLE, get_log_correlation_context
 
 try:
     import httpx
@@ -33,6 +30,13 @@ except ImportError:
     httpx = None
     HTTPX_AVAILABLE = False
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 log_level = getattr(logging, LOG_LEVEL, logging.INFO)
 
@@ -41,6 +45,9 @@ DD_SITE = os.getenv("DD_SITE", "us5.datadoghq.com")
 DD_SERVICE = os.getenv("DD_SERVICE", "app")
 DD_ENV = os.getenv("DD_ENV", os.getenv("ENVIRONMENT", "dev"))
 
+# Top-level logger names whose sub-WARNING records are not shipped to Datadog
+DD_THIRD_PARTY_LOGGERS = frozenset({"sqlalchemy", "uvicorn", "fastapi"})
+
 DD_INTAKE_URLS = {
     "datadoghq.com": "https://http-intake.logs.datadoghq.com",
     "datadoghq.eu": "https://http-intake.logs.datadoghq.eu",
@@ -53,35 +60,104 @@ DD_INTAKE_URL = DD_INTAKE_URLS.get(DD_SITE, DD_INTAKE_URLS["datadoghq.com"])
 
 _LOGGING_CONFIGURED = False
 
+# LogRecord attribute carrying the structlog event dict to BatchingDatadogHandler
+EVENT_DICT_ATTR = "_structlog_event"
+
+# Sentinel that tells the sender thread to exit
+_STOP_SENDER = object()
+
+# Datadog accepts up to 5MB (uncompressed) and 1000 entries per request
+DD_MAX_PAYLOAD_BYTES = 4_500_000
+DD_SEND_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+# Event fields that are either mapped onto the Datadog entry or dropped
+_EXCLUDED_FIELDS = frozenset(
+    {"message", "level", "timestamp", "service", "env", "ddsource", "msg"}
+)
 
-def tracer_injection(_logger: Any, _log_method: str, event_dict: Dict) -> Dict:
+
+def _orjson_dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """
+    json.dumps-compatible serializer backed by orjson, returning bytes.
+    Values orjson rejects (ints over 64 bits, lone surrogates) fall back to json.dumps.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs)
+    except (orjson.JSONEncodeError, TypeError):
+        return json.dumps(obj, default=kwargs.get("default") or repr).encode()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    return _orjson_dumps_bytes(obj, **kwargs).decode()
+
+
+_json_renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+
+def render_with_event_dict(_logger: Any, _log_method: str, event_dict: Dict) -> tuple:
+    """
+    Render the event as JSON for stdout and attach the event dict to the LogRecord.
+    BatchingDatadogHandler reads the dict back instead of re-parsing the JSON line.
+    """
+    rendered = _json_renderer(_logger, _log_method, event_dict)
+    return (rendered,), {"extra": {EVENT_DICT_ATTR: event_dict}}
+
+
+def _inject_trace_context(_logger: Any, _log_method: str, event_dict: Dict) -> Dict:
     """
     Inject Datadog trace correlation into logs.
     Adds: dd.trace_id, dd.span_id, dd.service, dd.version, dd.env
     """
-    if DDTRACE_AVAILABLE and tracer:
-        try:
-            trace_context = tracer.get_log_correlation_context()
-            if trace_context:
-                event_dict.update(trace_context)
-        except Exception:
-            pass
+    try:
+        event_dict.update(get_log_correlation_context())
+    except Exception:
+        pass
     return event_dict
 
 
+def _skip_trace_context(_logger: Any, _log_method: str, event_dict: Dict) -> Dict:
+    return event_dict
+
+
+# Resolved once at import so the per-record processor does no availability checks
+tracer_injection = _inject_trace_context if DDTRACE_AVAILABLE else _skip_trace_context
+
+
 class BatchingDatadogHandler(logging.Handler):
     """
     Async logging handler that batches logs and sends to Datadog HTTP API.
     """
 
+    # logging.Handler still carries a __dict__; the slots just give the
+    # per-record hot path descriptor access instead of dict lookups
+    __slots__ = (
+        "api_key",
+        "intake_url",
+        "service",
+        "env",
+        "batch_size",
+        "flush_interval",
+        "max_payload_bytes",
+        "_batch",
+        "_lock",
+        "_client",
+        "_error_count",
+        "_last_flush",
+        "_flush_thread",
+        "_stop_flush",
+        "_send_queue",
+        "_sender_thread",
+    )
+
     def __init__(
         self,
         api_key: str,
         intake_url: str,
         service: str,
         env: str,
-        batch_size: int = 10,
+        batch_size: int = 500,
         flush_interval: float = 1.0,
+        max_payload_bytes: int = DD_MAX_PAYLOAD_BYTES,
     ):
         super().__init__()
         self.api_key = api_key
@@ -90,8 +166,11 @@ class BatchingDatadogHandler(logging.Handler):
         self.env = env
         self.batch_size = batch_size
         self.flush_interval = flush_interval
+        self.max_payload_bytes = max_payload_bytes
 
-        self._batch: List[Dict] = []
+        # deque.append is atomic, so emit() can append without taking _lock;
+        # _lock only serializes draining the batch
+        self._batch: deque[Dict] = deque()
         self._lock = threading.Lock()
         self._client: httpx.Client | None = None
         self._error_count = 0
@@ -99,45 +178,61 @@ class BatchingDatadogHandler(logging.Handler):
         self._flush_thread: threading.Thread | None = None
         self._stop_flush = threading.Event()
 
+        self._send_queue: Queue = Queue(maxsize=64)
+        self._sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
+        self._sender_thread.start()
+
         self._start_flush_thread()
 
     def _start_flush_thread(self):
         def auto_flush():
-            while not self._stop_flush.is_set():
-                time.sleep(self.flush_interval)
-                with self._lock:
-                    if self._batch and (time.monotonic() - self._last_flush) >= self.flush_interval:
-                        self._flush_batch()
+            # wait() returns True as soon as close() sets the event
+            while not self._stop_flush.wait(self.flush_interval):
+                if self._batch and (time.monotonic() - self._last_flush) >= self.flush_interval:
+                    self.flush()
 
         self._flush_thread = threading.Thread(target=auto_flush, daemon=True)
         self._flush_thread.start()
 
     def _get_client(self) -> httpx.Client:
         if self._client is None:
-            self._client = httpx.Client(timeout=5.0)
+            self._client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=4,
+                    max_keepalive_connections=4,
+                    keepalive_expiry=120,
+                ),
+                timeout=httpx.Timeout(5.0, connect=2.0),
+            )
         return self._client
 
     def _parse_log_data(self, record: logging.LogRecord) -> Dict:
+        event_dict = getattr(record, EVENT_DICT_ATTR, None)
+        if event_dict is not None:
+            return event_dict
+
         formatted_message = self.format(record)
         try:
-            return json.loads(formatted_message)
-        except (json.JSONDecodeError, TypeError):
-            try:
-                import ast
-
-                data = ast.literal_eval(formatted_message)
-                if isinstance(data, dict):
-                    return data
-            except (ValueError, SyntaxError):
-                pass
+            data = orjson.loads(formatted_message)
+        except (orjson.JSONDecodeError, TypeError):
             return {"message": formatted_message}
+        if isinstance(data, dict):
+            return data
+        return {"message": formatted_message}
 
     def _build_log_entry(self, record: logging.LogRecord) -> Dict:
         log_data = self._parse_log_data(record)
 
-        main_message = log_data.pop("msg", log_data.pop("message", self.format(record)))
-        log_level_value = log_data.pop("level", record.levelname.lower())
-        log_data.pop("timestamp", None)
+        main_message = log_data.get("msg")
+        if main_message is None:
+            main_message = log_data.get("message")
+        if main_message is None:
+            main_message = self.format(record)
+        elif not isinstance(main_message, str):
+            # Raw event dict value, e.g. logger.error(exc)
+            main_message = str(main_message)
+        log_level_value = log_data.get("level", record.levelname.lower())
 
         log_entry = {
             "message": main_message,
@@ -152,93 +247,125 @@ class BatchingDatadogHandler(logging.Handler):
             },
         }
 
-        dd_fields = {k: log_data.pop(k) for k in list(log_data.keys()) if k.startswith("dd.")}
-        log_entry.update(dd_fields)
-
         tags = [
             f"service:{self.service}",
             f"env:{self.env}",
             f"level:{log_level_value}",
         ]
 
-        excluded = {"message", "level", "timestamp", "service", "env", "ddsource", "msg"}
         for key, value in log_data.items():
-            if key not in excluded and value is not None:
-                if isinstance(value, (dict, list)):
-                    log_entry[key] = json.dumps(value)
+            if key.startswith("dd."):
+                log_entry[key] = value
+            elif key not in _EXCLUDED_FIELDS and value is not None:
+                if isinstance(value, (dict, list, tuple)):
+                    log_entry[key] = _orjson_dumps(value, default=repr)
                 else:
-                    log_entry[key] = str(value)
-                    if len(str(value)) < 200:
-                        tags.append(f"{key}:{str(value)}")
+                    str_value = str(value)
+                    log_entry[key] = str_value
+                    if len(str_value) < 200:
+                        tags.append(f"{key}:{str_value}")
 
         log_entry["ddtags"] = ",".join(tags)
         return log_entry
 
-    def _flush_batch(self):
-        if not self._batch:
-            return
-
-        payload = self._batch[:]
-        self._batch.clear()
+    def _drain_batch(self) -> List[Dict]:
+        # Called with _lock held. popleft() only drains what was there:
+        # records appended concurrently stay queued
+        popleft = self._batch.popleft
+        payload = [popleft() for _ in range(len(self._batch))]
         self._last_flush = time.monotonic()
+        return payload
 
-        def send():
+    def _enqueue_payload(self, payload: List[Dict]):
+        try:
+            self._send_queue.put_nowait(payload)
+        except Full:
+            # Sender is falling behind: drop the oldest pending batch
             try:
-                client = self._get_client()
-                response = client.post(
-                    self.intake_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-
-                if response.status_code == 200:
-                    with self._lock:
-                        if self._error_count > 0:
-                            sys.stderr.write(
-                                f"Datadog: recovered after {self._error_count} errors\n"
-                            )
-                            sys.stderr.flush()
-                            self._error_count = 0
-                else:
-                    with self._lock:
-                        self._error_count += 1
-                        if self._error_count <= 3:
-                            sys.stderr.write(
-                                f"Datadog HTTP error {response.status_code}: {response.text}\n"
-                            )
-                            sys.stderr.flush()
-            except Exception as e:
+                self._send_queue.get_nowait()
+            except Empty:
+                pass
+            try:
+                self._send_queue.put_nowait(payload)
+            except Full:
+                pass
+
+    def _sender_loop(self):
+        while True:
+            payload = self._send_queue.get()
+            if payload is _STOP_SENDER:
+                return
+            self._send(payload)
+
+    def _send(self, payload: List[Dict]):
+        try:
+            # default=str: event dict values reach here unconverted (dd.* fields)
+            body = _orjson_dumps_bytes(payload, default=str)
+            if len(body) > self.max_payload_bytes and len(payload) > 1:
+                middle = len(payload) // 2
+                self._send(payload[:middle])
+                self._send(payload[middle:])
+                return
+
+            client = self._get_client()
+            response = client.post(
+                self.intake_url,
+                content=gzip.compress(body, compresslevel=1),
+                headers=DD_SEND_HEADERS,
+            )
+
+            if response.status_code == 200:
+                with self._lock:
+                    if self._error_count > 0:
+                        sys.stderr.write(
+                            f"Datadog: recovered after {self._error_count} errors\n"
+                        )
+                        sys.stderr.flush()
+                        self._error_count = 0
+            else:
                 with self._lock:
                     self._error_count += 1
                     if self._error_count <= 3:
-                        sys.stderr.write(f"Datadog send error: {e}\n")
+                        sys.stderr.write(
+                            f"Datadog HTTP error {response.status_code}: {response.text}\n"
+                        )
                         sys.stderr.flush()
-
-        threading.Thread(target=send, daemon=True).start()
+        except Exception as e:
+            with self._lock:
+                self._error_count += 1
+                if self._error_count <= 3:
+                    sys.stderr.write(f"Datadog send error: {e}\n")
+                    sys.stderr.flush()
 
     def emit(self, record: logging.LogRecord):
         try:
             log_entry = self._build_log_entry(record)
 
-            with self._lock:
-                self._batch.append(log_entry)
-
-                if len(self._batch) >= self.batch_size:
-                    self._flush_batch()
+            self._batch.append(log_entry)
+            if len(self._batch) >= self.batch_size:
+                self.flush()
         except Exception:
             pass
 
     def flush(self):
+        # Only the drain is serialized; handing off to the sender happens outside _lock
         with self._lock:
-            self._flush_batch()
+            payload = self._drain_batch()
+        if payload:
+            self._enqueue_payload(payload)
 
     def close(self):
         self._stop_flush.set()
         if self._flush_thread:
             self._flush_thread.join(timeout=2.0)
 
-        with self._lock:
-            self._flush_batch()
+        self.flush()
+
+        try:
+            self._send_queue.put(_STOP_SENDER, timeout=2.0)
+        except Full:
+            pass
+        self._sender_thread.join(timeout=5.0)
 
         if self._client:
             self._client.close()
@@ -246,10 +373,69 @@ class BatchingDatadogHandler(logging.Handler):
         super().close()
 
 
+class ThirdPartyLogFilter(logging.Filter):
+    """
+    Keep framework chatter (SQL statements, access logs) out of Datadog.
+    Records from these loggers still reach stdout; only WARNING+ is shipped.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return (
+            record.levelno >= logging.WARNING
+            or record.name.partition(".")[0] not in DD_THIRD_PARTY_LOGGERS
+        )
+
+
 class HealthEndpointFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        message = record.getMessage()
-        return "/health" not in message and '"/health' not in message
+        # uvicorn access logs carry the path in record.args; check the raw
+        # pieces instead of %-formatting every record via getMessage()
+        args = record.args
+        if isinstance(args, tuple):
+            for arg in args:
+                if isinstance(arg, str) and "/health" in arg:
+                    return False
+        msg = record.msg
+        return not (isinstance(msg, str) and "/health" in msg)
+
+
+class DropOldestQueue(Queue):
+    """
+    Bounded log queue that never blocks producers: once maxlen records are
+    pending, each put() evicts the oldest one. Drops are reported to stderr
+    from the consumer side at most once per second.
+    """
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.dropped = 0
+        self._last_drop_report = 0.0
+        # Unbounded as far as Queue is concerned, so put() never waits
+        super().__init__()
+
+    def _init(self, maxsize: int):
+        self.queue = deque(maxlen=self.maxlen)
+
+    def _put(self, item: Any):
+        if len(self.queue) == self.maxlen:
+            self.dropped += 1
+        self.queue.append(item)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        item = super().get(block, timeout)
+        if self.dropped:
+            self._report_dropped()
+        return item
+
+    def _report_dropped(self):
+        now = time.monotonic()
+        if now - self._last_drop_report < 1.0:
+            return
+        self._last_drop_report = now
+        with self.mutex:
+            dropped, self.dropped = self.dropped, 0
+        sys.stderr.write(f"Logging: queue full, dropped {dropped} records\n")
+        sys.stderr.flush()
 
 
 def configure_logging(
@@ -278,17 +464,18 @@ def configure_logging(
                 intake_url=resolved_intake_url,
                 service=resolved_service,
                 env=resolved_env,
-                batch_size=10,
+                batch_size=500,
                 flush_interval=1.0,
             )
             dd_handler.setLevel(log_level)
+            dd_handler.addFilter(ThirdPartyLogFilter())
             handlers.append(dd_handler)
 
             atexit.register(dd_handler.close)
 
             sys.stderr.write(
                 "Datadog: initialized (service="
-                f"{resolved_service}, env={resolved_env}, batching=10 logs/request)\n"
+                f"{resolved_service}, env={resolved_env}, batching=500 logs/request, gzip)\n"
             )
             sys.stderr.flush()
         except Exception as e:
@@ -301,7 +488,7 @@ def configure_logging(
         sys.stderr.write("Datadog: httpx not available\n")
         sys.stderr.flush()
 
-    log_queue: Queue = Queue(maxsize=1000)
+    log_queue = DropOldestQueue(maxlen=1000)
     queue_handler = QueueHandler(log_queue)
     queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
     queue_listener.start()
@@ -351,7 +538,7 @@ def configure_logging(
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
             structlog.processors.EventRenamer("msg"),
-            structlog.processors.JSONRenderer(),
+            render_with_event_dict,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -23,7 +23,7 @@ ENVIRONMENT VARIABLES:
     POSTHOG_API_KEY: Project API key (required)
     POSTHOG_PERSONAL_API_KEY: Enables local evaluation (optional but recommended)
     POSTHOG_HOST: PostHog host (default: https://us.i.posthog.com)
-    POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 15)
+    POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 30, ±20% jitter)
 """
 
 from .client import (
@@ -24,17 +24,24 @@ ENVIRONMENT VARIABLES:
     POSTHOG_API_KEY: Project API key (required)
     POSTHOG_PERSONAL_API_KEY: Feature flags secure API key (enables local evaluation)
     POSTHOG_HOST: PostHog host (default: https://us.i.posthog.com)
-    POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 15)
+    POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 30, ±20% jitter)
     POSTHOG_DISTINCT_ID: Default distinct ID (default: SERVICE_NAME or "unknown-service")
     SERVICE_NAME: Service name used as fallback distinct ID
+    POSTHOG_FLAG_CACHE_TTL: Seconds to reuse a flag result (default: 5, 0 disables)
+    POSTHOG_FLAG_CACHE_SIZE: Max cached flag results (default: 10000)
+    POSTHOG_FLAG_OVERRIDES: Static flag values, e.g. "kill-switch=true,layout=v2"
+    POSTHOG_LOG_FLAG_CHECKS: Log every flag check (default: true)
 """
 
 from __future__ import annotations
 
+import contextvars
 import os
+import random
 import sys
 import threading
-from typing import Any
+import time
+from typing import Any, Callable
 
 # =============================================================================
 # STEP 1: CHECK OPTIONAL DEPENDENCIES
@@ -47,6 +54,34 @@ except ImportError:
     Posthog = None
     POSTHOG_AVAILABLE = False
 
+# Importing manor.logger is cheap: its logger is a lazy proxy that only
+# configures logging on first use
+try:
+    from manor.logger import logger as _logger
+except ImportError:
+    _logger = None
+
+# Level -> bound log method, resolved on first use of each level
+_LOG_METHODS: dict[str, Callable[..., Any]] = {}
+
+
+def _diag(level: str, message: str, **fields: Any) -> None:
+    """
+    Emit a structured diagnostic, using manor.logger if available.
+
+    Falls back to a JSON line on stderr if the logger is not available.
+    """
+    log_method = _LOG_METHODS.get(level)
+    if log_method is None:
+        if _logger is None:
+            import json
+            log_data = {"level": level, "msg": message, **fields}
+            sys.stderr.write(json.dumps(log_data, default=str) + "\n")
+            sys.stderr.flush()
+            return
+        log_method = _LOG_METHODS[level] = getattr(_logger, level, _logger.info)
+    log_method(message, **fields)
+
 
 # =============================================================================
 # STEP 2: CONFIGURATION FROM ENVIRONMENT
@@ -56,26 +91,108 @@ except ImportError:
 POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY", "")
 POSTHOG_PERSONAL_API_KEY = os.getenv("POSTHOG_PERSONAL_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "https://us.i.posthog.com")
-POSTHOG_POLL_INTERVAL = int(os.getenv("POSTHOG_POLL_INTERVAL", "15"))
+POSTHOG_POLL_INTERVAL = int(os.getenv("POSTHOG_POLL_INTERVAL", "30"))
+
+# Each process polls at a fixed interval within ±20% of POSTHOG_POLL_INTERVAL,
+# so replicas started together drift apart instead of refreshing flag
+# definitions in lockstep
+POSTHOG_POLL_JITTER = 0.2
+
+# In-process cache of flag results, so hot paths checking the same
+# (flag, user, properties) repeatedly skip the SDK evaluation
+POSTHOG_FLAG_CACHE_TTL = float(os.getenv("POSTHOG_FLAG_CACHE_TTL", "5"))
+POSTHOG_FLAG_CACHE_SIZE = int(os.getenv("POSTHOG_FLAG_CACHE_SIZE", "10000"))
 
-# Default distinct ID for service-level flags
-DEFAULT_DISTINCT_ID = os.getenv(
-    "POSTHOG_DISTINCT_ID",
-    os.getenv("SERVICE_NAME", "unknown-service"),
+# Per-check info logs; error/warning logs are always emitted
+_LOG_FLAG_CHECKS = os.getenv("POSTHOG_LOG_FLAG_CHECKS", "true").lower() not in ("0", "false", "no")
+
+
+def _parse_flag_overrides(raw: str) -> dict[str, str | bool]:
+    """
+    Parse POSTHOG_FLAG_OVERRIDES ("flagA=true,flagB=false,flagC=variant").
+
+    "true"/"false" become booleans; any other value is kept as a
+    multivariate variant string. Malformed entries are ignored.
+    """
+    overrides: dict[str, str | bool] = {}
+    for item in raw.split(","):
+        key, sep, value = item.partition("=")
+        key, value = key.strip(), value.strip()
+        if not sep or not key or not value:
+            continue
+        lowered = value.lower()
+        if lowered == "true":
+            overrides[key] = True
+        elif lowered == "false":
+            overrides[key] = False
+        else:
+            overrides[key] = value
+    return overrides
+
+
+# Flags pinned by configuration; checked before PostHog is consulted at all
+_STATIC_OVERRIDES = _parse_flag_overrides(os.getenv("POSTHOG_FLAG_OVERRIDES", ""))
+
+# Default distinct ID for service-level flags. Resolved once and interned:
+# it is used on every check without a user_id and ends up in cache keys.
+DEFAULT_DISTINCT_ID = sys.intern(
+    os.getenv(
+        "POSTHOG_DISTINCT_ID",
+        os.getenv("SERVICE_NAME", "unknown-service"),
+    )
 )
 
 
-def _get_service_env():
-    """Get service environment from ENVIRONMENT or DD_ENV, default to 'unknown'."""
-    return os.getenv("ENVIRONMENT") or os.getenv("DD_ENV") or "unknown"
+# Service environment from ENVIRONMENT or DD_ENV, default to 'unknown'.
+# Resolved once: it is attached to every flag evaluation.
+_SERVICE_ENV = os.getenv("ENVIRONMENT") or os.getenv("DD_ENV") or "unknown"
+_DEFAULT_PROPERTIES = {"service_env": _SERVICE_ENV}
 
 
 def _merge_properties(properties):
-    """Merge user properties with default service_env."""
-    default = {"service_env": _get_service_env()}
-    if properties:
-        default.update(properties)
-    return default
+    """
+    Merge user properties with default service_env.
+
+    Returns the shared default dict when there is nothing to merge, so
+    callers must treat the result as read-only.
+    """
+    if not properties:
+        return _DEFAULT_PROPERTIES
+    return {**_DEFAULT_PROPERTIES, **properties}
+
+
+# Per-request snapshot of all flags, set by FeatureFlagChecker.prime_request():
+# (distinct_id, merged properties, {flag_key: value})
+_flags_snapshot: contextvars.ContextVar[
+    tuple[str, dict[str, Any] | None, dict[str, str | bool]] | None
+] = contextvars.ContextVar("feature_flags_snapshot", default=None)
+
+
+def _snapshot_value(
+    feature_flag: str,
+    distinct_id: str,
+    properties: dict[str, Any] | None,
+) -> str | bool | None:
+    """
+    Look up a flag in the current request's snapshot.
+
+    Returns None if nothing was primed, the snapshot was taken for a
+    different user or properties, or the flag is not in it. Properties are
+    compared after merging, so passing the default service_env explicitly
+    still matches a snapshot primed without properties.
+    """
+    snapshot = _flags_snapshot.get()
+    if snapshot is None:
+        return None
+
+    snapshot_distinct_id, snapshot_properties, flags = snapshot
+    if distinct_id != snapshot_distinct_id:
+        return None
+    merged_properties = _merge_properties(properties)
+    if merged_properties is not snapshot_properties and merged_properties != snapshot_properties:
+        return None
+
+    return flags.get(feature_flag)
 
 
 # =============================================================================
@@ -102,15 +219,30 @@ class PostHogClient:
         POSTHOG_API_KEY: Project API key (required)
         POSTHOG_PERSONAL_API_KEY: Enables local evaluation (optional but recommended)
         POSTHOG_HOST: PostHog host (default: https://us.i.posthog.com)
-        POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 15)
+        POSTHOG_POLL_INTERVAL: Polling interval in seconds (default: 30, ±20% jitter)
     """
 
+    # Fixed per-instance attributes: no __dict__, slot-offset lookups
+    __slots__ = (
+        "_client",
+        "_flag_cache",
+        "_flag_cache_lock",
+        "_local_evaluation",
+        "_poll_interval",
+        "_snapshot",
+        "_snapshot_fetched_at",
+        "_snapshot_lock",
+    )
+
     # Singleton instance
     _instance: PostHogClient | None = None
 
     # Lock for thread-safe initialization
     _lock: threading.Lock = threading.Lock()
 
+    # Failed SDK calls across all instances (best-effort counter)
+    _errors: int = 0
+
     def __init__(self) -> None:
         """
         Initialize the PostHog client wrapper.
@@ -118,7 +250,19 @@ class PostHogClient:
         NOTE: Do not call directly. Use PostHogClient.get_instance() instead.
         """
         self._client: Posthog | None = None
-        self._initialized: bool = False
+
+        # (method, flag_key, distinct_id, properties...) -> (stored_at, value)
+        self._flag_cache: dict[tuple, tuple[float, Any]] = {}
+        self._flag_cache_lock = threading.Lock()
+
+        # Without local evaluation every SDK check is a network call, so
+        # service-level flags (default distinct ID, no custom targeting) are
+        # served from a get_all_flags snapshot refreshed once per poll interval
+        self._local_evaluation: bool = False
+        self._poll_interval: float = float(POSTHOG_POLL_INTERVAL)
+        self._snapshot: dict[str, str | bool] | None = None
+        self._snapshot_fetched_at: float = 0.0
+        self._snapshot_lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> PostHogClient | None:
@@ -126,8 +270,10 @@ class PostHogClient:
         Get or create the singleton PostHog client instance.
 
         THREAD SAFETY:
-            Uses double-check locking to ensure only one instance is created
-            even when called from multiple threads simultaneously.
+            The instance is only published to cls._instance after it is fully
+            initialized, so the fast path is a single lock-free read. The lock
+            is taken only for the one-time creation, so concurrent first
+            callers still create exactly one instance.
 
         Returns:
             PostHogClient instance if successfully initialized, None otherwise.
@@ -137,20 +283,22 @@ class PostHogClient:
             if client:
                 enabled = client.feature_enabled("my-flag", "user-123")
         """
-        # Fast path: instance already exists
-        if cls._instance is not None and cls._instance._client is not None:
-            return cls._instance
+        # Fast path: instance already published (never half-initialized)
+        instance = cls._instance
 
         # Slow path: need to create instance
-        with cls._lock:
-            # Double-check after acquiring lock
-            if cls._instance is None:
-                cls._instance = PostHogClient()
-                cls._instance._initialize()
+        if instance is None:
+            with cls._lock:
+                # Re-check after acquiring lock
+                instance = cls._instance
+                if instance is None:
+                    instance = PostHogClient()
+                    instance._initialize()
+                    cls._instance = instance
 
         # Return instance only if client was successfully created
-        if cls._instance._client is not None:
-            return cls._instance
+        if instance._client is not None:
+            return instance
 
         return None
 
@@ -165,8 +313,7 @@ class PostHogClient:
             if cls._instance is not None and cls._instance._client is not None:
                 try:
                     cls._instance._client.shutdown()
-                    sys.stderr.write("[FeatureFlags] Client shutdown\n")
-                    sys.stderr.flush()
+                    _diag("info", "posthog_client_shutdown")
                 except Exception:
                     pass
                 cls._instance._client = None
@@ -176,55 +323,164 @@ class PostHogClient:
         """
         Initialize the PostHog client.
 
-        This method is called automatically by get_instance().
+        Called exactly once per instance, by get_instance() under the lock
+        and before the instance is published; a re-init needs shutdown().
         """
-        # Prevent double initialization
-        if self._initialized:
-            return
-
-        self._initialized = True
-
         # Check if PostHog library is available
         if not POSTHOG_AVAILABLE:
-            sys.stderr.write(
-                "[FeatureFlags] PostHog library not installed. "
-                "Install with: pip install posthog\n"
+            _diag(
+                "warning",
+                "posthog_library_missing",
+                hint="pip install posthog",
             )
-            sys.stderr.flush()
             return
 
         # Check for API key
         if not POSTHOG_API_KEY:
-            sys.stderr.write(
-                "[FeatureFlags] POSTHOG_API_KEY not set. "
-                "Feature flags will be disabled.\n"
-            )
-            sys.stderr.flush()
+            _diag("warning", "posthog_api_key_missing", feature_flags="disabled")
             return
 
+        # Only local evaluation polls for flag definitions; without a
+        # personal API key the SDK never starts its poller
+        poll_interval = POSTHOG_POLL_INTERVAL * random.uniform(
+            1 - POSTHOG_POLL_JITTER, 1 + POSTHOG_POLL_JITTER
+        )
+        self._poll_interval = poll_interval
+        self._local_evaluation = bool(POSTHOG_PERSONAL_API_KEY)
+
         # Create PostHog client
         try:
             self._client = Posthog(
                 project_api_key=POSTHOG_API_KEY,
                 host=POSTHOG_HOST,
                 personal_api_key=POSTHOG_PERSONAL_API_KEY or None,
-                poll_interval=POSTHOG_POLL_INTERVAL,
+                poll_interval=poll_interval,
             )
 
-            local_eval = bool(POSTHOG_PERSONAL_API_KEY)
-            sys.stderr.write(
-                f"[FeatureFlags] Client initialized "
-                f"(host={POSTHOG_HOST}, "
-                f"poll_interval={POSTHOG_POLL_INTERVAL}s, "
-                f"local_evaluation={local_eval})\n"
+            _diag(
+                "info",
+                "posthog_client_initialized",
+                host=POSTHOG_HOST,
+                poll_interval=round(poll_interval, 1),
+                local_evaluation=self._local_evaluation,
             )
-            sys.stderr.flush()
 
         except Exception as e:
-            sys.stderr.write(f"[FeatureFlags] Failed to initialize: {e}\n")
-            sys.stderr.flush()
+            _diag("error", "posthog_init_failed", error=str(e))
             self._client = None
 
+    @classmethod
+    def _record_error(cls, error: Exception) -> None:
+        """
+        Count a failed SDK call; report the first few.
+
+        The public methods still swallow errors (callers get None / {}),
+        but failures are no longer completely silent.
+        """
+        cls._errors += 1
+        if cls._errors <= 3:
+            _diag("error", "posthog_call_failed", errors=cls._errors, error=str(error))
+
+    @staticmethod
+    def _cache_key(*parts: Any) -> tuple | None:
+        """
+        Build a hashable cache key, or None if any part is unhashable.
+
+        Dict parts (properties, groups) are keyed by their items.
+        """
+        key = tuple(
+            frozenset(part.items()) if isinstance(part, dict) else part
+            for part in parts
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cached(self, key: tuple | None, evaluate: Callable[[], Any]) -> Any:
+        """
+        Return a cached flag result for key, or evaluate and cache it.
+
+        Only non-None results are cached, so errors are retried on the
+        next call. When the cache is full the oldest entry is evicted.
+        """
+        if key is None or POSTHOG_FLAG_CACHE_TTL <= 0:
+            return evaluate()
+
+        now = time.monotonic()
+        cached = self._flag_cache.get(key)
+        if cached is not None and now - cached[0] < POSTHOG_FLAG_CACHE_TTL:
+            return cached[1]
+
+        value = evaluate()
+        if value is not None:
+            with self._flag_cache_lock:
+                if key not in self._flag_cache and len(self._flag_cache) >= POSTHOG_FLAG_CACHE_SIZE:
+                    # dicts keep insertion order: the first key is the oldest
+                    self._flag_cache.pop(next(iter(self._flag_cache)), None)
+                self._flag_cache[key] = (now, value)
+        return value
+
+    def _service_flag(
+        self,
+        flag_key: str,
+        distinct_id: str,
+        groups: dict[str, str] | None,
+        person_properties: dict[str, Any] | None,
+        group_properties: dict[str, dict[str, Any]] | None,
+    ) -> str | bool | None:
+        """
+        Serve a service-level flag from the get_all_flags snapshot.
+
+        Only used without local evaluation, for the default distinct ID and
+        no custom groups/properties. The snapshot is refreshed on the calling
+        thread at most once per poll interval (no background thread, so it
+        is safe to create before a pre-fork server forks).
+
+        Returns:
+            The flag value, or None if the snapshot doesn't apply or lacks it
+        """
+        if (
+            self._local_evaluation
+            or distinct_id != DEFAULT_DISTINCT_ID
+            or groups
+            or group_properties
+            or (person_properties is not None and person_properties != _DEFAULT_PROPERTIES)
+        ):
+            return None
+
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_fetched_at >= self._poll_interval:
+            self._refresh_snapshot(now)
+
+        snapshot = self._snapshot
+        return snapshot.get(flag_key) if snapshot is not None else None
+
+    def _refresh_snapshot(self, now: float) -> None:
+        """
+        Re-fetch all service-level flags.
+
+        Only one thread refreshes; concurrent callers keep using the
+        previous snapshot (or fall back to a per-flag check) meanwhile.
+        """
+        if not self._snapshot_lock.acquire(blocking=False):
+            return
+        try:
+            # Stamped up front so a failing fetch is retried next interval,
+            # not on every check
+            self._snapshot_fetched_at = now
+            flags = self._client.get_all_flags(
+                DEFAULT_DISTINCT_ID,
+                person_properties=_DEFAULT_PROPERTIES,
+            )
+            if flags is not None:
+                self._snapshot = flags
+        except Exception as e:
+            self._record_error(e)
+        finally:
+            self._snapshot_lock.release()
+
     def feature_enabled(
         self,
         flag_key: str,
@@ -246,6 +502,9 @@ class PostHogClient:
         Returns:
             True if enabled, False if disabled, None if error/unavailable
 
+        Results are cached for POSTHOG_FLAG_CACHE_TTL seconds per
+        (flag, distinct_id, groups, properties).
+
         Example:
             client = PostHogClient.get_instance()
             if client:
@@ -258,6 +517,31 @@ class PostHogClient:
         if self._client is None:
             return None
 
+        value = self._service_flag(
+            flag_key, distinct_id, groups, person_properties, group_properties
+        )
+        if value is not None:
+            return bool(value)
+
+        return self._cached(
+            self._cache_key(
+                "feature_enabled", flag_key, distinct_id,
+                groups, person_properties, group_properties,
+            ),
+            lambda: self._feature_enabled(
+                flag_key, distinct_id, groups, person_properties, group_properties
+            ),
+        )
+
+    def _feature_enabled(
+        self,
+        flag_key: str,
+        distinct_id: str,
+        groups: dict[str, str] | None,
+        person_properties: dict[str, Any] | None,
+        group_properties: dict[str, dict[str, Any]] | None,
+    ) -> bool | None:
+        """Uncached feature_enabled() call into the SDK."""
         try:
             return self._client.feature_enabled(
                 flag_key,
@@ -266,7 +550,8 @@ class PostHogClient:
                 person_properties=person_properties,
                 group_properties=group_properties,
             )
-        except Exception:
+        except Exception as e:
+            self._record_error(e)
             return None
 
     def get_feature_flag(
@@ -290,6 +575,8 @@ class PostHogClient:
         Returns:
             The flag value (string for multivariate, bool for boolean, None if error)
 
+        Results are cached like feature_enabled().
+
         Example:
             client = PostHogClient.get_instance()
             if client:
@@ -302,6 +589,31 @@ class PostHogClient:
         if self._client is None:
             return None
 
+        value = self._service_flag(
+            flag_key, distinct_id, groups, person_properties, group_properties
+        )
+        if value is not None:
+            return value
+
+        return self._cached(
+            self._cache_key(
+                "get_feature_flag", flag_key, distinct_id,
+                groups, person_properties, group_properties,
+            ),
+            lambda: self._get_feature_flag(
+                flag_key, distinct_id, groups, person_properties, group_properties
+            ),
+        )
+
+    def _get_feature_flag(
+        self,
+        flag_key: str,
+        distinct_id: str,
+        groups: dict[str, str] | None,
+        person_properties: dict[str, Any] | None,
+        group_properties: dict[str, dict[str, Any]] | None,
+    ) -> str | bool | None:
+        """Uncached get_feature_flag() call into the SDK."""
         try:
             return self._client.get_feature_flag(
                 flag_key,
@@ -310,7 +622,8 @@ class PostHogClient:
                 person_properties=person_properties,
                 group_properties=group_properties,
             )
-        except Exception:
+        except Exception as e:
+            self._record_error(e)
             return None
 
     def get_all_flags(
@@ -319,10 +632,16 @@ class PostHogClient:
         groups: dict[str, str] | None = None,
         person_properties: dict[str, Any] | None = None,
         group_properties: dict[str, dict[str, Any]] | None = None,
+        only_evaluate_locally: bool = False,
     ) -> dict[str, str | bool]:
         """
         Get all feature flags for a user.
 
+        With only_evaluate_locally=True, flags that can't be evaluated from
+        the local definitions (not loaded yet, cohorts, experience
+        continuity) are left out instead of falling back to a request to
+        PostHog.
+
         Returns:
             Dictionary of flag_key -> flag_value
         """
@@ -335,8 +654,10 @@ class PostHogClient:
                 groups=groups,
                 person_properties=person_properties,
                 group_properties=group_properties,
+                only_evaluate_locally=only_evaluate_locally,
             )
-        except Exception:
+        except Exception as e:
+            self._record_error(e)
             return {}
 
     def capture(
@@ -364,8 +685,8 @@ class PostHogClient:
                 event,
                 properties=properties,
             )
-        except Exception:
-            pass
+        except Exception as e:
+            self._record_error(e)
 
 
 # =============================================================================
@@ -396,10 +717,25 @@ class FeatureFlagChecker:
         if variant == "new":
             show_new_checkout()
 
+        # Evaluate all flags once for the current request; later checks for
+        # the same user are served from that snapshot
+        token = FeatureFlagChecker.prime_request(user_id="user-123")
+        try:
+            handle_request()
+        finally:
+            FeatureFlagChecker.reset_request(token)
+
     LOGGING:
-        All flag checks are logged for debugging and auditing.
+        All flag checks are logged for debugging and auditing, unless
+        POSTHOG_LOG_FLAG_CHECKS=false.
+
+    OVERRIDES:
+        Flags listed in POSTHOG_FLAG_OVERRIDES return their configured value
+        without consulting PostHog (e.g. kill switches).
     """
 
+    __slots__ = ("_feature_flag",)
+
     def __init__(self, feature_flag: str) -> None:
         """
         Create a checker for a specific feature flag.
@@ -485,7 +821,31 @@ class FeatureFlagChecker:
                 default="control",
             )
         """
-        client = PostHogClient.get_instance()
+        # Pinned by POSTHOG_FLAG_OVERRIDES
+        override = _STATIC_OVERRIDES.get(feature_flag)
+        if override is not None:
+            return override
+
+        distinct_id = user_id or DEFAULT_DISTINCT_ID
+
+        # Served from the request snapshot if prime_request() covered it
+        value = _snapshot_value(feature_flag, distinct_id, properties)
+        if value is not None:
+            if _LOG_FLAG_CHECKS:
+                cls._log(
+                    "info",
+                    "posthog_feature_flag_value",
+                    feature_flag=feature_flag,
+                    value=value,
+                    distinct_id=distinct_id,
+                )
+            return value
+
+        # Fast path: read the published singleton directly; only go through
+        # get_instance() (and its lock) until a live client exists
+        client = PostHogClient._instance
+        if client is None or client._client is None:
+            client = PostHogClient.get_instance()
         if client is None:
             cls._log(
                 "warning",
@@ -494,7 +854,6 @@ class FeatureFlagChecker:
             )
             return default
 
-        distinct_id = user_id or DEFAULT_DISTINCT_ID
         merged_properties = _merge_properties(properties)
 
         try:
@@ -504,13 +863,14 @@ class FeatureFlagChecker:
                 person_properties=merged_properties,
             )
 
-            cls._log(
-                "info",
-                "posthog_feature_flag_value",
-                feature_flag=feature_flag,
-                value=value,
-                distinct_id=distinct_id,
-            )
+            if _LOG_FLAG_CHECKS:
+                cls._log(
+                    "info",
+                    "posthog_feature_flag_value",
+                    feature_flag=feature_flag,
+                    value=value,
+                    distinct_id=distinct_id,
+                )
 
             return value if value is not None else default
 
@@ -523,6 +883,63 @@ class FeatureFlagChecker:
             )
             return default
 
+    @classmethod
+    def prime_request(
+        cls,
+        user_id: str | None = None,
+        properties: dict[str, Any] | None = None,
+        local_only: bool = False,
+    ) -> contextvars.Token | None:
+        """
+        Evaluate all flags once and serve later checks from that snapshot.
+
+        Checks in the current context (request, task) for the same user_id
+        and properties use the snapshot instead of evaluating each flag
+        through the SDK. Flags missing from it fall back to a normal check.
+
+        Args:
+            user_id: Optional user identifier for targeting
+            properties: Optional user properties for targeting
+            local_only: Skip priming (return None) unless flags are evaluated
+                locally, and leave out flags the local definitions can't
+                resolve, so the call never waits on a request to PostHog
+
+        Returns:
+            Token for reset_request(), or None if the client is unavailable
+            or local_only ruled out priming
+
+        Example:
+            token = FeatureFlagChecker.prime_request(user_id="user-123")
+            try:
+                if FeatureFlagChecker.is_flag_enabled("a", user_id="user-123"):
+                    ...
+            finally:
+                FeatureFlagChecker.reset_request(token)
+        """
+        client = PostHogClient.get_instance()
+        if client is None or (local_only and not client._local_evaluation):
+            return None
+
+        distinct_id = user_id or DEFAULT_DISTINCT_ID
+        merged_properties = _merge_properties(properties)
+        flags = client.get_all_flags(
+            distinct_id,
+            person_properties=merged_properties,
+            only_evaluate_locally=local_only,
+        )
+        return _flags_snapshot.set((distinct_id, merged_properties, flags))
+
+    @staticmethod
+    def reset_request(token: contextvars.Token | None) -> None:
+        """
+        Drop the snapshot set by prime_request().
+
+        Args:
+            token: The token returned by prime_request() (None is ignored)
+        """
+        if token is not None:
+            _flags_snapshot.reset(token)
+
     @classmethod
     def _check_flag(
         cls,
@@ -541,7 +958,32 @@ class FeatureFlagChecker:
         Returns:
             True if enabled, False otherwise
         """
-        client = PostHogClient.get_instance()
+        # Pinned by POSTHOG_FLAG_OVERRIDES
+        override = _STATIC_OVERRIDES.get(feature_flag)
+        if override is not None:
+            return bool(override)
+
+        distinct_id = user_id or DEFAULT_DISTINCT_ID
+
+        # Served from the request snapshot if prime_request() covered it
+        value = _snapshot_value(feature_flag, distinct_id, properties)
+        if value is not None:
+            enabled = bool(value)
+            if _LOG_FLAG_CHECKS:
+                cls._log(
+                    "info",
+                    "posthog_feature_flag_checked",
+                    feature_flag=feature_flag,
+                    enabled=enabled,
+                    distinct_id=distinct_id,
+                )
+            return enabled
+
+        # Fast path: read the published singleton directly; only go through
+        # get_instance() (and its lock) until a live client exists
+        client = PostHogClient._instance
+        if client is None or client._client is None:
+            client = PostHogClient.get_instance()
         if client is None:
             cls._log(
                 "warning",
@@ -550,7 +992,6 @@ class FeatureFlagChecker:
             )
             return False
 
-        distinct_id = user_id or DEFAULT_DISTINCT_ID
         merged_properties = _merge_properties(properties)
 
         try:
@@ -560,13 +1001,14 @@ class FeatureFlagChecker:
                 person_properties=merged_properties,
             )
 
-            cls._log(
-                "info",
-                "posthog_feature_flag_checked",
-                feature_flag=feature_flag,
-                enabled=enabled,
-                distinct_id=distinct_id,
-            )
+            if _LOG_FLAG_CHECKS:
+                cls._log(
+                    "info",
+                    "posthog_feature_flag_checked",
+                    feature_flag=feature_flag,
+                    enabled=enabled,
+                    distinct_id=distinct_id,
+                )
 
             return bool(enabled) if enabled is not None else False
 
@@ -586,16 +1028,7 @@ class FeatureFlagChecker:
 
         Falls back to stderr if logger not available.
         """
-        try:
-            from manor.logger import logger
-            log_method = getattr(logger, level, logger.info)
-            log_method(message, **kwargs)
-        except ImportError:
-            # Fallback to stderr
-            import json
-            log_data = {"level": level, "msg": message, **kwargs}
-            sys.stderr.write(json.dumps(log_data) + "\n")
-            sys.stderr.flush()
+        _diag(level, message, **kwargs)
 
 
 # =============================================================================
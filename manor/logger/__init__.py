@@ -36,6 +36,7 @@ from .context import (
     get_extra_context,
     get_request_id,
     inject_request_context,
+    reset_request_id,
     set_extra_context,
     set_request_id,
     with_request_context,
@@ -58,6 +59,7 @@ __all__ = [
     "RequestContextMiddleware",
     "get_request_id",
     "set_request_id",
+    "reset_request_id",
     "generate_request_id",
     "get_correlation_headers",
     "get_extra_context",
@@ -49,8 +49,19 @@ HEADERS USED:
 from __future__ import annotations
 
 import contextvars
-import uuid
-from typing import Any, Callable
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+# Optional: dd-trace for trace propagation headers (resolved once at import,
+# not on every outbound call)
+try:
+    from ddtrace import tracer
+    DDTRACE_AVAILABLE = True
+except ImportError:
+    tracer = None
+    DDTRACE_AVAILABLE = False
 
 # =============================================================================
 # CONTEXT VARIABLES
@@ -71,6 +82,45 @@ _extra_context: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar(
 )
 
 
+# =============================================================================
+# REQUEST ID ENTROPY
+# =============================================================================
+# Random bytes for request IDs are read from the OS in batches of
+# _ENTROPY_BATCH IDs (one syscall per batch instead of per request) and kept
+# as hex. The buffer is discarded in forked children so workers never hand
+# out the parent's IDs.
+
+_ENTROPY_BATCH = 128
+_entropy_lock = threading.Lock()
+_entropy_hex = ""
+_entropy_offset = 0
+
+
+def _reset_entropy() -> None:
+    # A fresh lock too: another parent thread may have held it at fork time
+    global _entropy_lock, _entropy_hex, _entropy_offset
+    _entropy_lock = threading.Lock()
+    _entropy_hex = ""
+    _entropy_offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_entropy)
+
+
+def _next_random_hex() -> str:
+    """
+    Return 32 random hex characters (16 bytes) from the entropy buffer.
+    """
+    global _entropy_hex, _entropy_offset
+    with _entropy_lock:
+        offset = _entropy_offset
+        if offset >= len(_entropy_hex):
+            _entropy_hex = os.urandom(16 * _ENTROPY_BATCH).hex()
+            offset = 0
+        _entropy_offset = offset + 32
+        return _entropy_hex[offset:offset + 32]
+
+
 # =============================================================================
 # CONTEXT GETTERS AND SETTERS
 # =============================================================================
@@ -91,7 +141,7 @@ def get_request_id() -> str | None:
     return _request_id.get()
 
 
-def set_request_id(request_id: str) -> None:
+def set_request_id(request_id: str) -> contextvars.Token[str | None]:
     """
     Set the request ID for the current context.
     
@@ -100,10 +150,27 @@ def set_request_id(request_id: str) -> None:
     Args:
         request_id: The request ID to set
     
+    Returns:
+        Token that restores the previous request ID via reset_request_id()
+    
     Example:
-        set_request_id("abc-123-def-456")
+        token = set_request_id("abc-123-def-456")
+        try:
+            ...
+        finally:
+            reset_request_id(token)
+    """
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: contextvars.Token[str | None]) -> None:
+    """
+    Restore the request ID that was current before set_request_id().
+    
+    Args:
+        token: The token returned by set_request_id()
     """
-    _request_id.set(request_id)
+    _request_id.reset(token)
 
 
 def generate_request_id() -> str:
@@ -112,20 +179,29 @@ def generate_request_id() -> str:
     
     Uses UUID4 for guaranteed uniqueness across all services.
     
+    The string is formatted straight from batched os.urandom() bytes rather
+    than via str(uuid.uuid4()), which skips building a UUID object and a
+    getrandom() syscall on every request.
+    
     Returns:
         A new UUID string like "550e8400-e29b-41d4-a716-446655440000"
     """
-    return str(uuid.uuid4())
+    h = _next_random_hex()
+    # Version nibble is 4; the variant nibble must be one of 8, 9, a, b (RFC 4122)
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
-def get_extra_context() -> dict[str, Any]:
+def get_extra_context() -> Mapping[str, Any]:
     """
     Get all extra context fields.
     
+    The stored dict is replaced, never mutated, by set_extra_context(), so
+    a read-only view is returned instead of a copy.
+    
     Returns:
-        Dictionary of extra context fields
+        Read-only mapping of extra context fields
     """
-    return _extra_context.get().copy()
+    return MappingProxyType(_extra_context.get())
 
 
 def set_extra_context(**kwargs: Any) -> None:
@@ -140,16 +216,15 @@ def set_extra_context(**kwargs: Any) -> None:
     Example:
         set_extra_context(user_id="user-123", tenant_id="tenant-456")
     """
-    current = _extra_context.get().copy()
-    current.update(kwargs)
-    _extra_context.set(current)
+    _extra_context.set({**_extra_context.get(), **kwargs})
 
 
 def clear_context() -> None:
     """
     Clear all context for the current request.
     
-    Called by middleware at the end of a request.
+    Useful in tests and manual setups. Middleware and with_request_context()
+    instead restore the previous values via the tokens from set_request_id().
     """
     _request_id.set(None)
     _extra_context.set({})
@@ -182,32 +257,31 @@ def get_correlation_headers() -> dict[str, str]:
                 )
             return response.json()
     """
-    headers: dict[str, str] = {}
-    
-    # Add request ID
-    request_id = get_request_id()
-    if request_id:
-        headers["X-Request-ID"] = request_id
-        headers["X-Correlation-ID"] = request_id  # Alias for compatibility
+    # Add request ID (X-Correlation-ID is an alias for compatibility)
+    request_id = _request_id.get()
+    headers: dict[str, str] = (
+        {"X-Request-ID": request_id, "X-Correlation-ID": request_id}
+        if request_id
+        else {}
+    )
     
     # Add Datadog trace context if available
-    try:
-        from ddtrace import tracer
-        span = tracer.current_span()
-        if span:
-            # Add Datadog-specific headers
-            headers["x-datadog-trace-id"] = str(span.trace_id)
-            headers["x-datadog-parent-id"] = str(span.span_id)
-            
-            # Add W3C traceparent for interoperability
-            # Format: version-trace_id-parent_id-flags
-            trace_id_hex = format(span.trace_id, "032x")
-            span_id_hex = format(span.span_id, "016x")
-            headers["traceparent"] = f"00-{trace_id_hex}-{span_id_hex}-01"
-    except ImportError:
-        pass
-    except Exception:
-        pass
+    if DDTRACE_AVAILABLE:
+        try:
+            span = tracer.current_span()
+            if span:
+                trace_id = span.trace_id
+                span_id = span.span_id
+                headers.update({
+                    # Datadog-specific headers
+                    "x-datadog-trace-id": str(trace_id),
+                    "x-datadog-parent-id": str(span_id),
+                    # W3C traceparent for interoperability
+                    # Format: version-trace_id-parent_id-flags
+                    "traceparent": f"00-{trace_id:032x}-{span_id:016x}-01",
+                })
+        except Exception:
+            pass
     
     return headers
 
@@ -230,7 +304,14 @@ def inject_request_context(
         - Any extra context set via set_extra_context()
     
     IMPORTANT: Add this processor to your structlog configuration.
-    
+
+    WHY NOT structlog.contextvars.merge_contextvars:
+        merge_contextvars copies the whole context and scans every variable
+        in it (ddtrace's included) on each log. Reading our two variables
+        directly is several times cheaper, and the request ID must stay in
+        its own variable for get_request_id(), get_correlation_headers()
+        and the token-based restore in the middleware.
+
     Args:
         logger: The structlog logger (unused)
         method_name: The log method name (unused)
@@ -248,18 +329,17 @@ def inject_request_context(
             ],
         )
     """
+    # Add extra context fields in one C-level merge; event_dict goes last
+    # so fields already on the log record win
+    extra = _extra_context.get()
+    if extra:
+        event_dict = {**extra, **event_dict}
+    
     # Add request ID if present
-    request_id = get_request_id()
+    request_id = _request_id.get()
     if request_id:
         event_dict["request_id"] = request_id
     
-    # Add extra context fields
-    extra = get_extra_context()
-    for key, value in extra.items():
-        # Don't overwrite existing fields
-        if key not in event_dict:
-            event_dict[key] = value
-    
     return event_dict
 
 
@@ -267,6 +347,11 @@ def inject_request_context(
 # FASTAPI MIDDLEWARE
 # =============================================================================
 
+# ASGI header names arrive lowercased. bytes == already rejects different
+# lengths in C before comparing contents, so no separate length check.
+_HEADER_REQUEST_ID = b"x-request-id"
+_HEADER_CORRELATION_ID = b"x-correlation-id"
+
 
 class RequestContextMiddleware:
     """
@@ -290,22 +375,41 @@ class RequestContextMiddleware:
         2. Middleware extracts "abc-123" and stores in context
         3. All logs during request include request_id="abc-123"
         4. Response includes X-Request-ID: "abc-123"
-        5. Context is cleared for next request
+        5. Context is restored to its pre-request values
     
     HEADER PRIORITY:
         1. X-Request-ID (preferred)
         2. X-Correlation-ID (fallback)
         3. Generate new UUID (if neither present)
+    
+    FEATURE FLAGS:
+        With prime_feature_flags=True, all flags for the default (service)
+        distinct ID are evaluated once on request entry, and service-level
+        checks during the request are served from that snapshot. See
+        FeatureFlagChecker.prime_request(). Priming runs on the event loop,
+        so it only happens with local evaluation (POSTHOG_PERSONAL_API_KEY);
+        without it, evaluating the flags would be a blocking HTTP call.
     """
 
-    def __init__(self, app: Any):
+    def __init__(self, app: Any, prime_feature_flags: bool = False):
         """
         Initialize the middleware.
         
         Args:
             app: The ASGI application
+            prime_feature_flags: Snapshot service-level feature flags per request
         """
         self.app = app
+        self.prime_feature_flags = prime_feature_flags
+        # Resolved here rather than per request (and not at module level:
+        # manor.feature_flags imports manor.logger)
+        self._flag_checker: Any = None
+        if prime_feature_flags:
+            try:
+                from manor.feature_flags import FeatureFlagChecker
+                self._flag_checker = FeatureFlagChecker
+            except Exception:
+                pass
 
     async def __call__(
         self,
@@ -321,34 +425,67 @@ class RequestContextMiddleware:
             receive: ASGI receive callable
             send: ASGI send callable
         """
-        # Only process HTTP requests
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
+        # Only process HTTP requests; lifespan and websocket scopes pass
+        # straight through before any per-request state is built
+        app = self.app
+        if scope.get("type") != "http":
+            await app(scope, receive, send)
             return
         
         # Extract request ID from headers
-        request_id = self._extract_request_id(scope)
+        request_id, request_id_bytes = self._extract_request_id(scope)
         
-        # Set context for this request
-        set_request_id(request_id)
+        # Set context for this request, remembering what to restore
+        request_token = _request_id.set(request_id)
+        extra_before = _extra_context.get()
+        flags_token = self._prime_feature_flags() if self._flag_checker is not None else None
         
         # Wrapper to inject request ID into response headers
         async def send_with_request_id(message: dict[str, Any]) -> None:
             if message["type"] == "http.response.start":
-                # Add request ID to response headers
-                headers = list(message.get("headers", []))
-                headers.append((b"x-request-id", request_id.encode()))
-                message["headers"] = headers
+                # Add request ID to response headers. Servers and frameworks
+                # build a fresh list per response, so append in place and
+                # only copy other iterables
+                headers = message.get("headers")
+                if headers is None:
+                    message["headers"] = [(_HEADER_REQUEST_ID, request_id_bytes)]
+                elif isinstance(headers, list):
+                    headers.append((_HEADER_REQUEST_ID, request_id_bytes))
+                else:
+                    message["headers"] = [*headers, (_HEADER_REQUEST_ID, request_id_bytes)]
             await send(message)
         
         try:
             # Process the request
-            await self.app(scope, receive, send_with_request_id)
+            await app(scope, receive, send_with_request_id)
         finally:
-            # Always clear context after request
-            clear_context()
+            # Always restore context after request. Extra context is only
+            # written back if the request changed it.
+            #
+            # A copied Context can't replace this: ctx.run() only covers
+            # creating the coroutine, not awaiting it, and running the app
+            # in a new task with context=ctx costs more than these resets
+            # and detaches cancellation from the server's task.
+            _request_id.reset(request_token)
+            if _extra_context.get() is not extra_before:
+                _extra_context.set(extra_before)
+            if flags_token is not None:
+                self._flag_checker.reset_request(flags_token)
+
+    def _prime_feature_flags(self) -> contextvars.Token | None:
+        """
+        Snapshot service-level feature flags for this request.
+        
+        Returns:
+            Token to reset the snapshot, or None if flags are unavailable
+            or not evaluated locally
+        """
+        try:
+            return self._flag_checker.prime_request(local_only=True)
+        except Exception:
+            return None
 
-    def _extract_request_id(self, scope: dict[str, Any]) -> str:
+    def _extract_request_id(self, scope: dict[str, Any]) -> tuple[str, bytes]:
         """
         Extract request ID from headers or generate a new one.
         
@@ -356,22 +493,30 @@ class RequestContextMiddleware:
             scope: ASGI scope dictionary
         
         Returns:
-            The request ID (extracted or generated)
-        """
-        headers = dict(scope.get("headers", []))
+            The request ID (extracted or generated) and its encoded form
+            for the response header. Header values are returned as received.
         
-        # Try X-Request-ID first
-        request_id = headers.get(b"x-request-id")
-        if request_id:
-            return request_id.decode()
+        The str form is decoded here, once per request, rather than stored as
+        bytes and decoded lazily: every log line, get_request_id() caller and
+        get_correlation_headers() call would otherwise pay for the decode.
+        """
+        # Single pass over the raw ASGI header list: X-Request-ID wins as
+        # soon as it is seen, X-Correlation-ID is remembered as a fallback
+        correlation_id = None
+        for name, value in scope.get("headers", ()):
+            if not value:
+                continue
+            if name == _HEADER_REQUEST_ID:
+                return value.decode("latin-1"), value
+            if name == _HEADER_CORRELATION_ID and correlation_id is None:
+                correlation_id = value
         
-        # Try X-Correlation-ID as fallback
-        correlation_id = headers.get(b"x-correlation-id")
-        if correlation_id:
-            return correlation_id.decode()
+        if correlation_id is not None:
+            return correlation_id.decode("latin-1"), correlation_id
         
         # Generate new ID if not present
-        return generate_request_id()
+        request_id = generate_request_id()
+        return request_id, request_id.encode("ascii")
 
 
 # =============================================================================
@@ -379,6 +524,39 @@ class RequestContextMiddleware:
 # =============================================================================
 
 
+class _RequestContext:
+    """
+    Sync and async context manager behind with_request_context().
+    
+    Defined once at module level so entering a context only allocates
+    the instance.
+    """
+
+    __slots__ = ("request_id", "_token", "_extra_before")
+
+    def __init__(self, request_id: str | None):
+        self.request_id = request_id or generate_request_id()
+        self._token: contextvars.Token[str | None] | None = None
+        self._extra_before: dict[str, Any] = {}
+
+    def __enter__(self) -> str:
+        self._token = _request_id.set(self.request_id)
+        self._extra_before = _extra_context.get()
+        return self.request_id
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        _request_id.reset(self._token)
+        if _extra_context.get() is not self._extra_before:
+            _extra_context.set(self._extra_before)
+        return False
+
+    async def __aenter__(self) -> str:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return self.__exit__(exc_type, exc_val, exc_tb)
+
+
 def with_request_context(request_id: str | None = None):
     """
     Context manager for manual request context setup.
@@ -398,24 +576,4 @@ def with_request_context(request_id: str | None = None):
                 logger.info("Processing task", task_id=task_id)
                 # All logs here include request_id
     """
-    class RequestContextManager:
-        def __init__(self, rid: str | None):
-            self.request_id = rid or generate_request_id()
-        
-        def __enter__(self):
-            set_request_id(self.request_id)
-            return self.request_id
-        
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            clear_context()
-            return False
-        
-        async def __aenter__(self):
-            set_request_id(self.request_id)
-            return self.request_id
-        
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            clear_context()
-            return False
-    
-    return RequestContextManager(request_id)
+    return _RequestContext(request_id)
@@ -4,18 +4,24 @@ Direct Datadog logger for worker contexts (Celery).
 
 from __future__ import annotations
 
+import atexit
+import json
 import os
+import threading
 import time
+from queue import Empty, Full, Queue
 
 import httpx
+import orjson
 
 try:
-    from ddtrace import tracer
+    import h2  # noqa: F401
 
-    DDTRACE_AVAILABLE = True
+    HTTP2_AVAILABLE = True
 except ImportError:
-    tracer = None
-    DDTRACE_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+from .trace_context import get_log_correlation_context
 
 DD_API_KEY = os.getenv("DD_API_KEY")
 DD_SITE = os.getenv("DD_SITE", "us5.datadoghq.com")
@@ -28,6 +34,34 @@ DD_INTAKE_URL = (
 DEFAULT_SERVICE = os.getenv("DD_SERVICE", "app")
 DEFAULT_ENV = os.getenv("DD_ENV", os.getenv("ENVIRONMENT", "dev"))
 _WARNED_MISSING_KEY = False
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_time_ns = time.time_ns
+_QUEUE_SIZE = 10000
+_MAX_BATCH = 500
+# Longest process exit waits for queued entries when the intake is slow or down
+_EXIT_FLUSH_TIMEOUT = 5.0
+
+
+def _dumps_batch(batch: list) -> bytes:
+    # default=str: one odd extra field must not fail the entries batched with it.
+    # json fallback for what orjson rejects (ints over 64 bits, lone surrogates)
+    try:
+        return orjson.dumps(batch, default=str)
+    except TypeError:
+        return json.dumps(batch, default=str).encode()
+
+
+def _create_http_client() -> httpx.Client:
+    # Single intake host: one HTTP/2 connection kept alive across idle gaps
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=4,
+            max_keepalive_connections=4,
+            keepalive_expiry=120,
+        ),
+        timeout=httpx.Timeout(5.0, connect=2.0),
+    )
 
 
 class DirectDatadogLogger:
@@ -48,44 +82,111 @@ class DirectDatadogLogger:
             if resolved_api_key
             else None
         )
-        self.client = httpx.Client(timeout=5.0) if self.intake_url else None
+        self.client = _create_http_client() if self.intake_url else None
+        self._tag_prefix = f"service:{self.service},env:{self.env},level:"
+        self._tags_by_level = {
+            lvl: self._tag_prefix + lvl
+            for lvl in ("debug", "info", "warning", "error", "critical")
+        }
+        self._base_entry = {"service": self.service, "ddsource": "python"}
+        self._queue: Queue = Queue(maxsize=_QUEUE_SIZE)
+        self._sender_pid: int | None = None
+        self.dropped = 0
+        if self.client is None:
+            # Disabled: swap the method once instead of re-checking the key per call
+            self.log = self._log_missing_key
+
+    def _log_missing_key(self, message: str, level: str = "info", **extra_fields):
+        global _WARNED_MISSING_KEY
+        if not _WARNED_MISSING_KEY:
+            print("[DD ERROR] DD_API_KEY not set - skipping log delivery")
+            _WARNED_MISSING_KEY = True
+        self.log = self._skip_log
+
+    def _skip_log(self, message: str, level: str = "info", **extra_fields):
+        return None
+
+    def _start_sender(self) -> None:
+        """
+        Start the background sender for this process.
+        Called on first log and again after a fork, where the parent's
+        thread, queue and connections are not usable.
+        """
+        pid = os.getpid()
+        if self._sender_pid is not None:
+            self._queue = Queue(maxsize=_QUEUE_SIZE)
+            self.client = _create_http_client()
+        else:
+            atexit.register(self.flush, _EXIT_FLUSH_TIMEOUT)
+        self._sender_pid = pid
+        threading.Thread(
+            target=self._send_loop,
+            args=(self._queue,),
+            name="dd-direct-logger",
+            daemon=True,
+        ).start()
+
+    def _send_loop(self, queue: Queue) -> None:
+        while True:
+            batch = [queue.get()]
+            try:
+                while len(batch) < _MAX_BATCH:
+                    batch.append(queue.get_nowait())
+            except Empty:
+                pass
+            try:
+                self.client.post(
+                    self.intake_url, content=_dumps_batch(batch), headers=_JSON_HEADERS
+                )
+            except Exception as e:
+                print(f"[DD ERROR] failed to send {len(batch)} logs ({e})")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Block until every queued entry has been sent, or timeout seconds pass.
+        Returns False if entries were still pending at the timeout.
+        """
+        if self._sender_pid != os.getpid():
+            return True
+        queue = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with queue.all_tasks_done:
+            while queue.unfinished_tasks:
+                if deadline is None:
+                    queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                queue.all_tasks_done.wait(remaining)
+        return True
 
     def log(self, message: str, level: str = "info", **extra_fields):
-        global _WARNED_MISSING_KEY
-        if not self.intake_url or not self.client:
-            if not _WARNED_MISSING_KEY:
-                print("[DD ERROR] DD_API_KEY not set - skipping log delivery")
-                _WARNED_MISSING_KEY = True
-            return
         try:
-            tags = f"service:{self.service},env:{self.env},level:{level}"
+            tags = self._tags_by_level.get(level) or self._tag_prefix + level
             if extra_fields:
-                tags += "," + ",".join(f"{k}:{v}" for k, v in extra_fields.items())
-
-            log_entry = {
-                "message": message,
-                "level": level,
-                "timestamp": int(time.time() * 1000),
-                "service": self.service,
-                "ddsource": "python",
-                "ddtags": tags,
-            }
-
-            if DDTRACE_AVAILABLE and tracer:
-                try:
-                    trace_context = tracer.get_log_correlation_context()
-                    if trace_context:
-                        log_entry.update(trace_context)
-                except Exception:
-                    pass
+                tags += "," + ",".join([f"{k}:{v}" for k, v in extra_fields.items()])
+
+            log_entry = self._base_entry.copy()
+            log_entry["message"] = message
+            log_entry["level"] = level
+            log_entry["timestamp"] = _time_ns() // 1_000_000
+            log_entry["ddtags"] = tags
 
+            log_entry.update(get_log_correlation_context())
             log_entry.update(extra_fields)
 
-            self.client.post(
-                self.intake_url,
-                json=[log_entry],
-                headers={"Content-Type": "application/json"},
-            )
+            # Only enqueue here; the HTTP round trip happens on the sender thread
+            if self._sender_pid != os.getpid():
+                self._start_sender()
+            try:
+                self._queue.put_nowait(log_entry)
+            except Full:
+                self.dropped += 1
+                return
 
             print(f"[DD] {message}")
         except Exception as e:
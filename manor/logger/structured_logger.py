@@ -13,23 +13,29 @@ HOW IT WORKS:
 
 GUNICORN/FORK SAFETY:
     - Logger is initialized lazily (on first use, not on import)
-    - HTTP client is recreated after fork (detects PID change)
+    - HTTP client and background threads are recreated after fork
+      (os.register_at_fork)
     - Safe to use with: gunicorn --preload, uvicorn, or any WSGI/ASGI server
 """
 
 from __future__ import annotations
 
 import atexit
+import gzip
 import json
 import logging
 import os
+import random
 import sys
 import threading
 import time
+import weakref
+from collections import deque
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
+from queue import Empty, Full, Queue
 from typing import Any
 
+import orjson
 import structlog
 
 
@@ -38,13 +44,9 @@ import structlog
 # =============================================================================
 # These libraries are optional. The logger works without them.
 
-# ddtrace: Datadog APM tracing (adds trace_id/span_id to logs)
-try:
-    from ddtrace import tracer
-    DDTRACE_AVAILABLE = True
-except ImportError:
-    tracer = None
-    DDTRACE_AVAILABLE = False
+# ddtrace: Datadog APM tracing (adds trace_id/span_id to logs). The
+# correlation dict is cached per active span in trace_context.
+from .trace_context import DDTRACE_AVAILABLE, get_log_correlation_context
 
 # httpx: HTTP client for sending logs to Datadog
 try:
@@ -54,6 +56,13 @@ except ImportError:
     httpx = None
     HTTPX_AVAILABLE = False
 
+# h2: HTTP/2 support for httpx (installed with httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 # =============================================================================
 # STEP 2: READ CONFIGURATION FROM ENVIRONMENT
@@ -69,6 +78,19 @@ DD_SITE = os.getenv("DD_SITE", "us5.datadoghq.com")  # Datadog region
 DD_SERVICE = os.getenv("DD_SERVICE", "app")  # Service name in Datadog
 DD_ENV = os.getenv("DD_ENV", os.getenv("ENVIRONMENT", "dev"))  # Environment tag
 
+# Datadog Logs API v2 accepts at most 1000 entries per request
+DD_MAX_ENTRIES_PER_PAYLOAD = 1000
+
+# Failed batches (429, gateway errors, network errors) are retried with
+# exponential backoff - 0.5s, 1s, 2s - or after the server's Retry-After
+DD_SEND_ATTEMPTS = 4
+DD_RETRY_BASE_SECONDS = 0.5
+DD_MAX_RETRY_AFTER_SECONDS = 30.0
+_RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+
+# Per-request header for gzipped payloads; the static headers live on the client
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
 # Datadog HTTP intake URLs by region (for Logs API v2)
 # Format: https://http-intake.logs.{site}
 DD_INTAKE_URLS = {
@@ -81,7 +103,7 @@ DD_INTAKE_URLS = {
 
 
 # =============================================================================
-# STEP 3: SINGLETON STATE
+# STEP 3: SINGLETON STATE AND JSON RENDERING
 # =============================================================================
 # These variables ensure the logger is configured only once, even in
 # multi-threaded environments.
@@ -96,6 +118,58 @@ _logger_lock = threading.Lock()
 _is_configured = False
 
 
+def _orjson_dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """
+    json.dumps-compatible serializer backed by orjson, returning UTF-8 bytes.
+    
+    structlog passes default= for objects JSON can't encode; orjson accepts
+    the same keyword. Non-string keys are stringified like json.dumps does.
+    
+    orjson rejects some values the stdlib accepts (ints wider than 64 bits,
+    strings with lone surrogates). Those fall back to json.dumps, so a log
+    call never fails because of what was logged.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs)
+    except (orjson.JSONEncodeError, TypeError):
+        default = kwargs.get("default") or repr
+        return json.dumps(obj, default=default).encode()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Like _orjson_dumps_bytes, returning str (the structlog serializer)."""
+    return _orjson_dumps_bytes(obj, **kwargs).decode()
+
+
+_json_renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+# Event dict keys DatadogHttpHandler maps to its own entry fields instead of
+# copying them as attributes
+_CONSUMED_KEYS = frozenset(("msg", "message", "level", "timestamp"))
+
+# LogRecord attribute carrying the structlog event dict to DatadogHttpHandler
+_EVENT_DICT_ATTR = "_structlog_event"
+
+
+def render_with_event_dict(
+    logger_instance: Any,
+    method_name: str,
+    event_dict: dict[str, Any],
+) -> tuple[tuple[str], dict[str, Any]]:
+    """
+    Render the event as JSON and attach the event dict to the LogRecord.
+    
+    This is the last structlog processor. The JSON string becomes the
+    record message (for stdout), and the event dict rides along on the
+    record so DatadogHttpHandler can use it without parsing the JSON back.
+    
+    Returns:
+        (args, kwargs) for the stdlib logger method
+    """
+    rendered = _json_renderer(logger_instance, method_name, event_dict)
+    return (rendered,), {"extra": {_EVENT_DICT_ATTR: event_dict}}
+
+
 # =============================================================================
 # STEP 4: DATADOG TRACE INJECTION
 # =============================================================================
@@ -122,6 +196,8 @@ def add_datadog_trace_context(
     
     WHEN IT RUNS:
         Every time you call logger.info(), logger.error(), etc.
+        The fields are built once per active span and cached in the current
+        context, so a log under an unchanged span only merges a cached dict.
     
     Args:
         logger_instance: The structlog logger (unused but required by API)
@@ -135,17 +211,10 @@ def add_datadog_trace_context(
     if not DDTRACE_AVAILABLE:
         return event_dict
     
-    # Skip if tracer is not available
-    if tracer is None:
-        return event_dict
-    
-    # Try to get trace context from ddtrace
+    # Add the active span's trace fields to the log entry
+    # Example: {"dd.trace_id": "123", "dd.span_id": "456", ...}
     try:
-        trace_context = tracer.get_log_correlation_context()
-        if trace_context:
-            # Add all trace fields to the log entry
-            # Example: {"dd.trace_id": "123", "dd.span_id": "456", ...}
-            event_dict.update(trace_context)
+        event_dict.update(get_log_correlation_context())
     except Exception:
         # Never fail logging because of trace injection
         pass
@@ -160,6 +229,51 @@ def add_datadog_trace_context(
 # It batches logs for efficiency and sends them in background threads.
 
 
+# Handlers not yet closed, reset in each forked child. Weak references, so
+# the at-fork hook doesn't keep discarded handlers alive.
+_open_handlers: weakref.WeakSet[DatadogHttpHandler] = weakref.WeakSet()
+
+
+def _reset_handlers_after_fork() -> None:
+    for handler in list(_open_handlers):
+        handler._reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_handlers_after_fork)
+
+
+# Loggers used by the handler's own HTTP client, and its sender thread's name
+_HTTP_CLIENT_LOGGER_PREFIXES = ("httpx", "httpcore")
+_SENDER_THREAD_NAME = "datadog-log-sender"
+
+
+def _is_not_own_http_traffic(record: logging.LogRecord) -> bool:
+    """
+    Handler filter that drops logs caused by sending logs.
+    
+    A warning from httpx while posting a batch would otherwise be queued
+    for Datadog, posted, possibly warn again, and so on. Records from the
+    HTTP client libraries and from the sender thread itself are dropped
+    (they still reach the console handler).
+    """
+    return not (
+        record.name.startswith(_HTTP_CLIENT_LOGGER_PREFIXES)
+        or record.threadName == _SENDER_THREAD_NAME
+    )
+
+
+def _parse_retry_after(response: Any) -> float | None:
+    """
+    Read a Retry-After header given in seconds, capped at
+    DD_MAX_RETRY_AFTER_SECONDS. Returns None if absent or not a number.
+    """
+    try:
+        retry_after = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+    return min(max(retry_after, 0.0), DD_MAX_RETRY_AFTER_SECONDS)
+
+
 class DatadogHttpHandler(logging.Handler):
     """
     Logging handler that sends logs to Datadog via HTTP.
@@ -167,21 +281,25 @@ class DatadogHttpHandler(logging.Handler):
     FEATURES:
         - Batching: Collects logs and sends them in batches (default: 10)
         - Auto-flush: Sends logs every second even if batch is not full
-        - Non-blocking: Sends logs in background threads
+        - Non-blocking: Sends logs from a single background sender thread
         - Fork-safe: Recreates HTTP client after process fork
     
     HOW IT WORKS:
         1. emit() is called for each log message
         2. Log is added to internal batch
         3. When batch is full OR 1 second passes:
-           - Batch is sent to Datadog in a background thread
+           - The flush thread wakes and queues the batch for the sender thread,
+             which posts it to Datadog
            - New batch starts collecting
+        4. If Datadog falls behind and the sender queue fills up, new
+           batches are dropped instead of piling up in memory
     
     FORK SAFETY:
         When using Gunicorn with multiple workers, each worker is a separate
         process created via fork(). HTTP connections cannot be shared across
-        fork boundaries. This handler detects fork by comparing PIDs and
-        creates a new HTTP client in the child process.
+        fork boundaries, and the handler's background threads don't survive
+        fork. A hook registered with os.register_at_fork gives every open
+        handler a new HTTP client and new threads in the child process.
     """
 
     def __init__(
@@ -192,6 +310,7 @@ class DatadogHttpHandler(logging.Handler):
         site: str,
         batch_size: int = 10,
         flush_interval_seconds: float = 1.0,
+        max_pending_logs: int = 10_000,
     ):
         """
         Initialize the Datadog handler.
@@ -203,6 +322,7 @@ class DatadogHttpHandler(logging.Handler):
             site: Datadog site/region (e.g., us5.datadoghq.com)
             batch_size: Number of logs to collect before sending
             flush_interval_seconds: Max time to wait before sending
+            max_pending_logs: Logs held before the oldest are dropped
         """
         super().__init__()
         
@@ -218,27 +338,53 @@ class DatadogHttpHandler(logging.Handler):
         base_url = DD_INTAKE_URLS.get(site, DD_INTAKE_URLS["datadoghq.com"])
         self.intake_url = f"{base_url}/api/v2/logs"
         
-        # Batch storage: list of log entries waiting to be sent
-        self._pending_logs: list[dict[str, Any]] = []
+        # Tags shared by every entry, built once instead of per record
+        self._static_tag_prefix = f"service:{service},env:{env}"
         
-        # Lock for thread-safe access to _pending_logs
-        self._batch_lock = threading.Lock()
+        # Batch storage: log entries waiting to be sent. deque.append is
+        # atomic, so emit() adds entries without taking a lock. Bounded so a
+        # stalled flush can't grow memory without limit: once full, each new
+        # entry evicts the oldest, counted in _evicted_logs.
+        self._pending_logs: deque[dict[str, Any]] = deque(maxlen=max_pending_logs)
+        self._evicted_logs = 0
         
-        # Track when we last sent logs (for auto-flush timing)
-        self._last_flush_time = time.monotonic()
+        # Lock serializing the threads that drain _pending_logs
+        self._batch_lock = threading.Lock()
         
         # Count consecutive errors (to avoid spamming stderr)
         self._consecutive_errors = 0
         
-        # Fork detection: store current PID
-        # If PID changes, we know we're in a forked child process
-        self._process_id = os.getpid()
+        # Logs dropped because the sender queue was full, since the last
+        # successful send (reported once when dropping starts and ends)
+        self._dropped_logs = 0
         
         # HTTP client (created lazily, recreated after fork)
         self._http_client: httpx.Client | None = None
         
-        # Background flush thread control
+        # Never ship logs produced by shipping logs
+        self.addFilter(_is_not_own_http_traffic)
+        
+        self._start_threads()
+        
+        # Fork detection: _reset_after_fork() runs in every forked child
+        _open_handlers.add(self)
+
+    def _start_threads(self) -> None:
+        """Create the send queue and start the sender and flush threads."""
+        # Sender thread: one long-lived thread posts queued batches in order.
+        # The queue is bounded so a slow Datadog can't grow memory without limit.
+        self._send_queue: Queue[list[dict[str, Any]] | None] = Queue(maxsize=32)
+        self._sender_thread = threading.Thread(
+            target=self._sender_loop,
+            daemon=True,
+            name=_SENDER_THREAD_NAME,
+        )
+        self._sender_thread.start()
+        
+        # Background flush thread control. _flush_now is set by emit() when
+        # a batch fills up (and by close()) to wake the thread early.
         self._stop_flush_thread = threading.Event()
+        self._flush_now = threading.Event()
         self._flush_thread = threading.Thread(
             target=self._background_flush_loop,
             daemon=True,  # Thread dies when main process exits
@@ -246,6 +392,26 @@ class DatadogHttpHandler(logging.Handler):
         )
         self._flush_thread.start()
 
+    def _reset_after_fork(self) -> None:
+        """
+        Make the handler usable in a forked child process.
+        
+        Only the thread that called fork() exists in the child, so the
+        sender and flush threads are gone, and any lock or queue they were
+        using may be stuck in a locked state. The HTTP client's sockets are
+        still shared with the parent. Everything is replaced:
+            - The HTTP client is dropped (not closed - the parent owns it)
+            - Pending logs are discarded (the parent sends its own copy)
+            - The lock, queue, events and threads are created fresh
+        """
+        self._http_client = None
+        self._pending_logs.clear()
+        self._evicted_logs = 0
+        self._batch_lock = threading.Lock()
+        self._consecutive_errors = 0
+        self._dropped_logs = 0
+        self._start_threads()
+
     # -------------------------------------------------------------------------
     # HTTP Client Management (Fork-Safe)
     # -------------------------------------------------------------------------
@@ -259,26 +425,29 @@ class DatadogHttpHandler(logging.Handler):
             including the HTTP client. But the underlying socket connections
             are shared with the parent, which causes problems.
             
-            Solution: Detect fork by comparing PIDs. If PID changed, we're in
-            a child process and must create a new HTTP client.
+            Solution: _reset_after_fork() runs in the child right after fork
+            (via os.register_at_fork) and drops the client, so a new one is
+            created here on the child's first send.
         
         Returns:
             An httpx.Client instance safe to use in the current process
         """
-        current_pid = os.getpid()
-        
-        # Check if we're in a forked child process
-        if self._process_id != current_pid:
-            # PID changed = we were forked
-            # Discard the old client (don't close it - parent owns it)
-            self._http_client = None
-            # Update our PID
-            self._process_id = current_pid
-        
-        # Create client if we don't have one
+        # Create client if we don't have one. Connections to the intake host
+        # are kept alive between batches, and the static headers live on the
+        # client instead of being passed with every request.
         if self._http_client is None:
             self._http_client = httpx.Client(
-                timeout=5.0,  # 5 second timeout for requests
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(5.0, connect=2.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=4,
+                    max_connections=8,
+                    keepalive_expiry=30.0,
+                ),
+                headers={
+                    "Content-Type": "application/json",
+                    "DD-API-KEY": self.api_key,
+                },
             )
         
         return self._http_client
@@ -287,6 +456,26 @@ class DatadogHttpHandler(logging.Handler):
     # Log Formatting
     # -------------------------------------------------------------------------
 
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Return the record's message text.
+        
+        Records arriving through the QueueHandler have already been
+        formatted (msg is the final text, args and exc_info are cleared),
+        so unless a formatter was set explicitly the message is returned
+        as is instead of going through Formatter.format() again.
+        """
+        if (
+            self.formatter is None
+            and not record.args
+            and not record.exc_info
+            and not record.exc_text
+            and not record.stack_info
+            and isinstance(record.msg, str)
+        ):
+            return record.msg
+        return super().format(record)
+
     def _convert_log_record_to_datadog_format(
         self,
         record: logging.LogRecord,
@@ -315,31 +504,33 @@ class DatadogHttpHandler(logging.Handler):
         Returns:
             Dictionary formatted for Datadog HTTP API
         """
-        # Get the formatted message (JSON string from structlog)
-        formatted_message = self.format(record)
-        
-        # Parse the JSON message
-        try:
-            log_data = json.loads(formatted_message)
-        except (json.JSONDecodeError, TypeError):
-            # If not JSON, wrap the raw message
-            log_data = {"message": formatted_message}
+        log_data = getattr(record, _EVENT_DICT_ATTR, None)
+        if log_data is None:
+            # Get the formatted message (JSON string or plain text)
+            formatted_message = self.format(record)
+            
+            # Only a JSON object can be a structlog message; anything else is
+            # plain text and skips the parser entirely
+            log_data = None
+            if formatted_message[:1] == "{":
+                try:
+                    log_data = orjson.loads(formatted_message)
+                except orjson.JSONDecodeError:
+                    pass
+            if log_data is None:
+                log_data = {"message": formatted_message}
         
         # Extract the main message (structlog uses "msg" key)
-        main_message = log_data.pop("msg", None)
+        main_message = log_data.get("msg")
         if main_message is None:
-            main_message = log_data.pop("message", formatted_message)
-        
-        # Extract log level
-        log_level = log_data.pop("level", record.levelname.lower())
-        
-        # Remove timestamp (we'll use record.created instead)
-        log_data.pop("timestamp", None)
+            main_message = log_data.get("message")
+        if main_message is None:
+            main_message = self.format(record)
         
-        # Build the Datadog log entry
+        # Build the Datadog log entry. The timestamp comes from record.created.
         datadog_entry: dict[str, Any] = {
             "message": main_message,
-            "level": log_level,
+            "level": log_data.get("level") or record.levelname.lower(),
             "timestamp": int(record.created * 1000),  # Milliseconds
             "service": self.service,
             "ddsource": "python",
@@ -348,34 +539,42 @@ class DatadogHttpHandler(logging.Handler):
             },
         }
         
-        # Move Datadog trace fields (dd.*) to top level
-        for key in list(log_data.keys()):
-            if key.startswith("dd."):
-                datadog_entry[key] = log_data.pop(key)
-        
-        # Build tags for Datadog facets
-        tags = [
-            f"service:{self.service}",
-            f"env:{self.env}",
-        ]
+        # Build per-record tags for Datadog facets (service/env are static)
+        tags: list[str] = []
         
-        # Add remaining fields as attributes and tags
+        # One pass over the fields: skip the ones consumed above, move dd.*
+        # trace fields to the top level, add the rest as attributes and tags.
+        # log_data is only read, so the structlog event dict is not copied.
         for key, value in log_data.items():
-            if value is None:
+            if value is None or key in _CONSUMED_KEYS:
+                continue
+            if key.startswith("dd."):
+                datadog_entry[key] = value
                 continue
             
-            # Add to log entry
-            if isinstance(value, (dict, list)):
-                datadog_entry[key] = json.dumps(value)
-            else:
+            # Add to log entry. Event dict values are raw Python objects, so
+            # anything that isn't a JSON scalar is stringified here. text is
+            # the string form used for the tag, computed at most once.
+            if isinstance(value, str):
+                datadog_entry[key] = text = value
+            elif isinstance(value, (int, float)):
                 datadog_entry[key] = value
+                text = str(value)
+            elif isinstance(value, (dict, list, tuple)):
+                datadog_entry[key] = text = _orjson_dumps(value, default=repr)
+            else:
+                datadog_entry[key] = text = str(value)
             
             # Add short values as tags (for Datadog facets)
-            if len(str(value)) < 100:
-                tags.append(f"{key}:{value}")
-        
-        # Join tags with commas
-        datadog_entry["ddtags"] = ",".join(tags)
+            if len(text) < 100:
+                tags.append(f"{key}:{text}")
+        
+        # Join tags with commas after the static prefix
+        datadog_entry["ddtags"] = (
+            self._static_tag_prefix + "," + ",".join(tags)
+            if tags
+            else self._static_tag_prefix
+        )
         
         return datadog_entry
 
@@ -385,86 +584,162 @@ class DatadogHttpHandler(logging.Handler):
 
     def _send_pending_logs_to_datadog(self) -> None:
         """
-        Send all pending logs to Datadog.
+        Hand all pending logs to the sender thread.
         
         MUST BE CALLED WITH self._batch_lock HELD.
         
         This method:
-            1. Copies pending logs to a local variable
-            2. Clears the pending logs list
-            3. Spawns a background thread to send the logs
+            1. Pops the pending logs into a local list
+            2. Queues the batch for the sender thread
         
-        The actual HTTP request happens in a background thread to avoid
-        blocking the main application.
+        The actual HTTP request happens on the sender thread to avoid
+        blocking the main application. If the sender queue is full, the
+        batch is dropped and counted in _dropped_logs.
+        
+        If emit() had to evict logs from the full pending buffer, a warning
+        entry with the count is queued after the batch, so the gap shows up
+        in Datadog itself.
         """
         # Nothing to send
         if not self._pending_logs:
             return
         
-        # Copy logs to send (we'll clear the pending list)
-        logs_to_send = self._pending_logs.copy()
-        self._pending_logs.clear()
-        self._last_flush_time = time.monotonic()
+        # Pop exactly the entries present now; entries appended concurrently
+        # by emit() stay pending for the next batch. Payloads are capped at
+        # the intake's limit of 1000 entries.
+        popleft = self._pending_logs.popleft
+        remaining = len(self._pending_logs)
+        while remaining:
+            count = min(remaining, DD_MAX_ENTRIES_PER_PAYLOAD)
+            remaining -= count
+            self._queue_batch([popleft() for _ in range(count)])
+        
+        evicted = self._evicted_logs
+        if evicted:
+            self._evicted_logs -= evicted
+            self._queue_batch([{
+                "message": f"Dropped {evicted} logs: Datadog log buffer full",
+                "level": "warning",
+                "timestamp": time.time_ns() // 1_000_000,
+                "service": self.service,
+                "ddsource": "python",
+                "logger": {"name": __name__},
+                "ddtags": self._static_tag_prefix,
+            }])
+
+    def _queue_batch(self, logs_to_send: list[dict[str, Any]]) -> None:
+        """Queue one batch for the sender thread, dropping it if the queue is full."""
+        try:
+            self._send_queue.put_nowait(logs_to_send)
+        except Full:
+            if not self._dropped_logs:
+                sys.stderr.write("Datadog send queue full: dropping logs\n")
+                sys.stderr.flush()
+            self._dropped_logs += len(logs_to_send)
+
+    def _sender_loop(self) -> None:
+        """
+        Background thread that posts queued batches to Datadog.
+        
+        Batches are sent one at a time, in the order they were queued.
+        A None in the queue tells the thread to exit.
+        """
+        while True:
+            logs_to_send = self._send_queue.get()
+            if logs_to_send is None:
+                return
+            self._post_logs(logs_to_send)
+
+    def _post_logs(self, logs_to_send: list[dict[str, Any]]) -> None:
+        """
+        Send one batch of logs to Datadog, retrying transient failures.
+        
+        The batch is serialized with orjson and gzipped here on the sender
+        thread. Structured log entries repeat the same keys and tags, so
+        even compresslevel=1 shrinks the payload 5-10x for little CPU.
         
-        # Capture api_key for the background thread
-        api_key = self.api_key
-        intake_url = self.intake_url
+        RETRIES:
+            Rate limiting (429), gateway errors (502/503/504) and network
+            errors are retried up to DD_SEND_ATTEMPTS times in total, with
+            exponential backoff plus jitter, or the server's Retry-After
+            when given. Retrying here on the sender thread keeps batches in
+            order: later batches wait in the queue until this one is done.
+            Retries stop early once the handler is closing.
+        
+        Args:
+            logs_to_send: Datadog log entries to post
+        """
+        try:
+            client = self._get_http_client()
+            body = gzip.compress(_orjson_dumps_bytes(logs_to_send, default=str), compresslevel=1)
+        except Exception as error:
+            self._report_send_error(f"Datadog send error: {error}")
+            return
         
-        # Define the send function for the background thread
-        def send_logs_in_background():
+        for attempt in range(DD_SEND_ATTEMPTS):
+            delay = DD_RETRY_BASE_SECONDS * 2**attempt + random.uniform(0, 0.1)
             try:
-                client = self._get_http_client()
-                response = client.post(
-                    intake_url,
-                    json=logs_to_send,
-                    headers={
-                        "Content-Type": "application/json",
-                        "DD-API-KEY": api_key,
-                    },
-                )
-                
+                response = client.post(self.intake_url, content=body, headers=_GZIP_HEADERS)
+            except httpx.TransportError as error:
+                # Network error or timeout - worth retrying
+                message = f"Datadog send error: {error}"
+            except Exception as error:
+                self._report_send_error(f"Datadog send error: {error}")
+                return
+            else:
                 # v2 API returns 202 on success
                 if response.status_code in (200, 202):
                     # Success - reset error counter
                     self._consecutive_errors = 0
-                else:
-                    # HTTP error
-                    self._consecutive_errors += 1
-                    if self._consecutive_errors <= 3:
+                    if self._dropped_logs:
                         sys.stderr.write(
-                            f"Datadog HTTP error: {response.status_code} - {response.text}\n"
+                            f"Datadog send queue recovered: {self._dropped_logs} logs dropped\n"
                         )
                         sys.stderr.flush()
-                        
-            except Exception as error:
-                self._consecutive_errors += 1
-                if self._consecutive_errors <= 3:
-                    sys.stderr.write(f"Datadog send error: {error}\n")
-                    sys.stderr.flush()
-        
-        # Send in background thread (non-blocking)
-        thread = threading.Thread(
-            target=send_logs_in_background,
-            daemon=True,
-            name="datadog-log-sender",
-        )
-        thread.start()
+                        self._dropped_logs = 0
+                    return
+                
+                # HTTP error
+                message = f"Datadog HTTP error: {response.status_code} - {response.text}"
+                if response.status_code not in _RETRY_STATUS_CODES:
+                    self._report_send_error(message)
+                    return
+                retry_after = _parse_retry_after(response)
+                if retry_after is not None:
+                    delay = retry_after
+            
+            # Give up after the last attempt, or right away when closing
+            if attempt + 1 == DD_SEND_ATTEMPTS or self._stop_flush_thread.wait(delay):
+                self._report_send_error(message)
+                return
+
+    def _report_send_error(self, message: str) -> None:
+        """Count a failed batch; only the first 3 in a row go to stderr."""
+        self._consecutive_errors += 1
+        if self._consecutive_errors <= 3:
+            sys.stderr.write(message + "\n")
+            sys.stderr.flush()
 
     def _background_flush_loop(self) -> None:
         """
         Background thread that periodically flushes logs.
         
         This ensures logs are sent even if the batch never fills up.
-        Runs every flush_interval_seconds and sends any pending logs.
+        Wakes every flush_interval_seconds, or immediately when emit()
+        fills a batch or close() is called, and sends any pending logs.
         """
-        while not self._stop_flush_thread.is_set():
-            # Sleep for the flush interval
-            time.sleep(self.flush_interval_seconds)
+        while True:
+            # Wait for the flush interval or an early wake-up
+            self._flush_now.wait(self.flush_interval_seconds)
+            self._flush_now.clear()
             
-            # Check if we have pending logs to send
-            with self._batch_lock:
-                if self._pending_logs:
+            # Check if we have pending logs to send (lock only if so)
+            if self._pending_logs:
+                with self._batch_lock:
                     self._send_pending_logs_to_datadog()
+            
+            if self._stop_flush_thread.is_set():
+                return
 
     # -------------------------------------------------------------------------
     # Logging Handler Interface
@@ -483,13 +758,16 @@ class DatadogHttpHandler(logging.Handler):
             # Convert to Datadog format
             datadog_entry = self._convert_log_record_to_datadog_format(record)
             
-            # Add to batch
-            with self._batch_lock:
-                self._pending_logs.append(datadog_entry)
-                
-                # Send if batch is full
-                if len(self._pending_logs) >= self.batch_size:
-                    self._send_pending_logs_to_datadog()
+            # Add to batch (no lock needed for the append)
+            pending_logs = self._pending_logs
+            if len(pending_logs) == pending_logs.maxlen:
+                self._evicted_logs += 1
+            pending_logs.append(datadog_entry)
+            
+            # Wake the flush thread if the batch is full; the application
+            # thread never drains or queues batches itself
+            if len(pending_logs) >= self.batch_size and not self._flush_now.is_set():
+                self._flush_now.set()
                     
         except Exception:
             # Never let logging errors crash the application
@@ -506,12 +784,20 @@ class DatadogHttpHandler(logging.Handler):
         
         Called when the handler is being shut down.
         """
-        # Stop the background flush thread
+        _open_handlers.discard(self)
+        
+        # Stop the background flush thread (it flushes once more on the way out)
         self._stop_flush_thread.set()
+        self._flush_now.set()
         self._flush_thread.join(timeout=2.0)
         
-        # Send any remaining logs
+        # Queue any remaining logs, then let the sender drain and exit
         self.flush()
+        try:
+            self._send_queue.put(None, timeout=2.0)
+        except Full:
+            pass
+        self._sender_thread.join(timeout=5.0)
         
         # Close HTTP client
         if self._http_client is not None:
@@ -522,9 +808,10 @@ class DatadogHttpHandler(logging.Handler):
 
 
 # =============================================================================
-# STEP 6: HEALTH CHECK FILTER
+# STEP 6: HEALTH CHECK FILTER AND LOG QUEUE
 # =============================================================================
-# Filters out noisy health check logs from load balancers and Kubernetes.
+# Filters out noisy health check logs from load balancers and Kubernetes, and
+# the queue that hands records from application threads to the handlers.
 
 
 class HealthCheckLogFilter(logging.Filter):
@@ -549,16 +836,122 @@ class HealthCheckLogFilter(logging.Filter):
         Returns:
             True to keep the log, False to discard it
         """
-        message = record.getMessage()
+        msg = record.msg
+        args = record.args
+        
+        # Check the template and its arguments before formatting them: uvicorn
+        # access logs carry the path in args, and most records are dropped or
+        # kept without ever running the % formatting
+        if isinstance(msg, str) and isinstance(args, tuple):
+            if "/health" in msg:
+                return False
+            for arg in args:
+                if isinstance(arg, str):
+                    if "/health" in arg:
+                        return False
+                elif not isinstance(arg, (int, float)):
+                    # An arbitrary object's str() might contain the path
+                    break
+            else:
+                return True
         
-        # Discard if message contains /health
-        if "/health" in message:
+        # Discard if the formatted message contains /health
+        if "/health" in record.getMessage():
             return False
         
         # Keep all other logs
         return True
 
 
+class RingBufferQueue:
+    """
+    Bounded log queue between QueueHandler and QueueListener.
+    
+    WHY NOT queue.Queue:
+        Queue.put_nowait() takes a lock and notifies a Condition on every
+        record, so under load every application thread serializes on it.
+        And when it is full, QueueHandler reports Full as a logging error.
+    
+    HOW IT WORKS:
+        - Records go into a deque(maxlen=...). On CPython, append() and
+          popleft() are atomic, so producers never take a lock.
+        - When full, appending evicts the oldest record (drop-oldest).
+        - The consumer blocks on an Event, which producers only set when
+          it isn't set already. A busy queue costs no lock at all.
+        - Dropped records are reported to stderr from the consumer side,
+          at most once per second.
+    
+    Implements just the put_nowait()/get() pair QueueHandler and
+    QueueListener use.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._buffer: deque[Any] = deque(maxlen=maxsize)
+        self._not_empty = threading.Event()
+        self._last_drop_report = 0.0
+
+    def put_nowait(self, item: Any) -> None:
+        """Append a record, evicting the oldest one if the buffer is full."""
+        buffer = self._buffer
+        if len(buffer) == self.maxsize:
+            # Unlocked, so the count is best-effort under contention
+            self.dropped += 1
+        buffer.append(item)
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Pop the oldest record, waiting for one if block is True.
+        
+        Raises:
+            queue.Empty: If no record arrives (non-blocking or timed out)
+        """
+        buffer = self._buffer
+        while True:
+            try:
+                item = buffer.popleft()
+            except IndexError:
+                if not block:
+                    raise Empty from None
+                # Clear, then re-check: a producer that appended before the
+                # clear saw the Event still set and didn't set it again
+                self._not_empty.clear()
+                if buffer:
+                    continue
+                if not self._not_empty.wait(timeout):
+                    raise Empty from None
+                continue
+            
+            if self.dropped:
+                self._report_dropped()
+            return item
+
+    def _report_dropped(self) -> None:
+        now = time.monotonic()
+        if now - self._last_drop_report < 1.0:
+            return
+        self._last_drop_report = now
+        dropped = self.dropped
+        self.dropped -= dropped
+        sys.stderr.write(f"Logging: queue full, dropped {dropped} records\n")
+        sys.stderr.flush()
+    
+    def _reset_after_fork(self) -> None:
+        """
+        Empty the queue in a forked child.
+        
+        The child inherits a copy of the parent's pending records, which the
+        parent's own listener is still going to emit. Keeping them would send
+        every one of them twice.
+        """
+        self._buffer.clear()
+        self.dropped = 0
+        self._not_empty = threading.Event()
+
+
 # =============================================================================
 # STEP 7: MAIN CONFIGURATION FUNCTION
 # =============================================================================
@@ -605,9 +998,11 @@ def configure_logging(
     
     # ----- FAST PATH: Already configured -----
     # If already configured, return the existing logger immediately.
-    # This check is outside the lock for performance.
-    if _is_configured and _logger_instance is not None:
-        return _logger_instance
+    # This check is outside the lock for performance. _logger_instance is
+    # assigned last during configuration, so it alone says we're done.
+    logger_instance = _logger_instance
+    if logger_instance is not None:
+        return logger_instance
     
     # ----- THREAD-SAFE INITIALIZATION -----
     # Only one thread should configure the logger.
@@ -615,7 +1010,7 @@ def configure_logging(
         
         # Double-check after acquiring lock
         # Another thread might have configured while we waited
-        if _is_configured and _logger_instance is not None:
+        if _logger_instance is not None:
             return _logger_instance
         
         # ----- RESOLVE CONFIGURATION -----
@@ -671,9 +1066,11 @@ def configure_logging(
         # Flow: logger.info() -> QueueHandler -> Queue -> QueueListener -> Handlers
         #
         # This makes logging non-blocking: the application just puts
-        # the log in the queue and continues immediately.
+        # the log in the queue and continues immediately. The queue never
+        # blocks or locks; if the listener falls behind, the oldest records
+        # are dropped.
         
-        log_queue: Queue[logging.LogRecord] = Queue(maxsize=1000)
+        log_queue = RingBufferQueue(maxsize=1000)
         
         # QueueHandler: Puts logs into the queue
         queue_handler = QueueHandler(log_queue)
@@ -689,13 +1086,26 @@ def configure_logging(
         # Ensure listener is stopped on exit
         atexit.register(queue_listener.stop)
         
+        # The listener thread doesn't survive fork either: restart it in the
+        # child (after the handlers have been reset by their own hook)
+        def restart_listener_after_fork() -> None:
+            log_queue._reset_after_fork()
+            queue_listener._thread = None
+            queue_listener.start()
+        
+        os.register_at_fork(after_in_child=restart_listener_after_fork)
+        
         # ----- CONFIGURE ROOT LOGGER -----
-        # All Python loggers inherit from the root logger
-        logging.basicConfig(
-            level=resolved_log_level,
-            format="%(message)s",  # structlog handles formatting
-            handlers=[queue_handler],
-        )
+        # All Python loggers inherit from the root logger. The queue handler
+        # is installed directly rather than via logging.basicConfig(), which
+        # silently does nothing if anything (even a stray logging.info()
+        # call) has already given the root logger a handler. No formatter:
+        # structlog handles formatting.
+        root_logger = logging.getLogger()
+        root_logger.setLevel(resolved_log_level)
+        for existing_handler in root_logger.handlers[:]:
+            root_logger.removeHandler(existing_handler)
+        root_logger.addHandler(queue_handler)
         
         # ----- CONFIGURE THIRD-PARTY LOGGERS -----
         
@@ -703,9 +1113,9 @@ def configure_logging(
         uvicorn_access_logger = logging.getLogger("uvicorn.access")
         uvicorn_access_logger.addFilter(HealthCheckLogFilter())
         
-        # Reduce httpx noise (only warnings and above)
-        httpx_logger = logging.getLogger("httpx")
-        httpx_logger.setLevel(logging.WARNING)
+        # Reduce httpx/httpcore noise (only warnings and above)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("httpcore").setLevel(logging.WARNING)
         
         # ----- CONFIGURE STRUCTLOG -----
         # structlog provides structured logging with key-value pairs
@@ -719,7 +1129,8 @@ def configure_logging(
         # 6. format_exc_info: Format exception info
         # 7. UnicodeDecoder: Ensure strings are unicode
         # 8. EventRenamer: Rename "event" to "msg"
-        # 9. JSONRenderer: Convert to JSON string
+        # 9. render_with_event_dict: Convert to JSON string (orjson-backed)
+        #    and hand the event dict to the Datadog handler
         
         # Import request context processor
         from manor.logger.context import inject_request_context
@@ -734,7 +1145,7 @@ def configure_logging(
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
                 structlog.processors.EventRenamer("msg"),
-                structlog.processors.JSONRenderer(),
+                render_with_event_dict,
             ],
             wrapper_class=structlog.stdlib.BoundLogger,
             context_class=dict,
@@ -745,6 +1156,7 @@ def configure_logging(
         # ----- MARK AS CONFIGURED -----
         _is_configured = True
         _logger_instance = structlog.get_logger()
+        logger._clear_cached_attributes()
         
         sys.stderr.write(
             f"Logger: READY "
@@ -779,8 +1191,13 @@ class LazyLoggerProxy:
         When you do `logger.info("Hello")`:
         1. Python calls LazyLoggerProxy.__getattr__("info")
         2. __getattr__ calls configure_logging() to get the real logger
-        3. __getattr__ returns the "info" method from the real logger
+        3. __getattr__ stores the "info" method from the real logger in the
+           proxy's __dict__ and returns it
         4. Python calls that method with "Hello"
+        
+        From then on `logger.info` is found in the proxy's __dict__ and
+        __getattr__ isn't called at all. configure_logging() clears these
+        cached attributes whenever it creates a new logger.
     
     USAGE:
         from manor.logger import logger
@@ -800,11 +1217,21 @@ class LazyLoggerProxy:
         Returns:
             The attribute from the real logger
         """
-        # Get or create the real logger
-        real_logger = configure_logging()
-        
-        # Return the requested attribute from the real logger
-        return getattr(real_logger, attribute_name)
+        # Get or create the real logger. Once configured this is a single
+        # global read; configure_logging() (and its lock) only runs until
+        # the first logger exists.
+        real_logger = _logger_instance
+        if real_logger is None:
+            real_logger = configure_logging()
+        
+        # Cache the attribute so later lookups skip __getattr__ entirely
+        value = getattr(real_logger, attribute_name)
+        self.__dict__[attribute_name] = value
+        return value
+
+    def _clear_cached_attributes(self) -> None:
+        """Forget attributes cached from a previous real logger."""
+        self.__dict__.clear()
 
 
 # =============================================================================
@@ -0,0 +1,53 @@
+"""
+Datadog trace correlation cached per execution context.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from typing import Any, Dict, Tuple
+
+try:
+    from ddtrace import tracer
+
+    DDTRACE_AVAILABLE = True
+except ImportError:
+    tracer = None
+    DDTRACE_AVAILABLE = False
+
+
+_EMPTY: Dict[str, str] = {}
+
+# (active span or context, its correlation dict). ddtrace builds a new dict on
+# every get_log_correlation_context() call; this reuses it while the active
+# span is unchanged. Keyed by the span itself rather than refreshed by span
+# start/finish hooks: a span finished on another thread or context would
+# leave the hooked value stale, and those hooks are ddtrace internals.
+_current_correlation: contextvars.ContextVar[Tuple[Any, Dict[str, str]] | None] = (
+    contextvars.ContextVar("dd_log_correlation", default=None)
+)
+
+
+def get_log_correlation_context() -> Dict[str, str]:
+    """
+    Return dd.trace_id, dd.span_id, dd.service, dd.version, dd.env for the
+    active span. Empty when ddtrace is not installed or the lookup fails.
+    Do not mutate.
+    """
+    if not DDTRACE_AVAILABLE:
+        return _EMPTY
+
+    try:
+        # Skips finished spans, so a span finished elsewhere is never reported
+        active = tracer.context_provider.active()
+        cached = _current_correlation.get()
+        if cached is not None and cached[0] is active:
+            return cached[1]
+
+        correlation = tracer.get_log_correlation_context()
+    except Exception:
+        # Never fail logging because of trace correlation
+        return _EMPTY
+
+    _current_correlation.set((active, correlation))
+    return correlation
@@ -23,20 +23,46 @@ Environment Variables:
     MCP_AUTH_TTL_SECONDS: Token TTL in seconds (default: 3600)
     MCP_AUTH_MARGIN_SECONDS: Refresh margin in seconds (default: 30)
     MCP_AUTH_FEATURE_FLAG: Feature flag key (default: manor_search_enable_mcp_api_token)
+    MCP_AUTH_DISABLED_CACHE_SECONDS: How long a disabled verdict (flag off or no
+        secret) is reused before checking again (default: 5, 0 to always check)
+
+    Values are read once and reused for up to a minute.
 """
 
+import base64
+import hashlib
+import hmac
+import json
 import os
 import sys
 import threading
 import time
 
-# Try to import PyJWT
+# Feature flags and logging are resolved once here instead of imported on
+# every token fetch. Both imports are cheap: neither creates a client or
+# configures logging until first use.
 try:
-    import jwt
-    JWT_AVAILABLE = True
+    from manor.feature_flags import is_enabled as _flag_is_enabled
 except ImportError:
-    jwt = None
-    JWT_AVAILABLE = False
+    _flag_is_enabled = None
+
+try:
+    from manor.logger import logger as _logger
+except ImportError:
+    _logger = None
+
+
+# How long configuration read from the environment is reused
+_CONFIG_TTL_SECONDS = 60
+
+
+def _b64url(data):
+    """Base64url-encode bytes without padding, as JWT requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Encoded JWT header; the same bytes PyJWT produces for HS256
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
 
 
 def _safe_int(value, default):
@@ -68,11 +94,17 @@ class MCPTokenProvider:
     _init_failed = False
 
     def __init__(self):
-        self._jwt_available = JWT_AVAILABLE
-        self._algorithm = "HS256"
-        self._token = None
-        self._token_exp = 0
+        # ((secret, issuer, audience, subject), JSON payload prefix with the
+        # claims, HMAC-SHA256 object keyed with the secret and fed no data)
+        self._signing_cache = (None, None, None)
+        # (token, monotonic expiry, Authorization header value), replaced as
+        # a whole so it can be read without the lock
+        self._token_state = (None, 0.0, None)
         self._token_lock = threading.Lock()
+        # While monotonic time is below this, MCP auth is known to be disabled
+        self._disabled_until_monotonic = 0.0
+        # (monotonic expiry, config dict), replaced as a whole
+        self._config_cache = (0.0, None)
 
     @classmethod
     def get_instance(cls):
@@ -96,6 +128,18 @@ class MCPTokenProvider:
         return cls._instance
 
     def _get_config(self):
+        """
+        Get configuration, re-reading the environment at most every
+        _CONFIG_TTL_SECONDS. Never raises.
+        """
+        now = time.monotonic()
+        expires, config = self._config_cache
+        if config is None or now >= expires:
+            config = self._read_config()
+            self._config_cache = (now + _CONFIG_TTL_SECONDS, config)
+        return config
+
+    def _read_config(self):
         """Read configuration from environment variables. Never raises."""
         return {
             "secret": os.getenv("MCP_AUTH_SECRET", ""),
@@ -107,6 +151,9 @@ class MCPTokenProvider:
             ),
             "ttl_seconds": _safe_int(os.getenv("MCP_AUTH_TTL_SECONDS"), 3600),
             "margin_seconds": _safe_int(os.getenv("MCP_AUTH_MARGIN_SECONDS"), 30),
+            "disabled_cache_seconds": _safe_int(
+                os.getenv("MCP_AUTH_DISABLED_CACHE_SECONDS"), 5
+            ),
             "feature_flag": os.getenv(
                 "MCP_AUTH_FEATURE_FLAG",
                 "manor_search_enable_mcp_api_token",
@@ -115,38 +162,59 @@ class MCPTokenProvider:
 
     def _is_feature_enabled(self, feature_flag):
         """Check if the MCP auth feature flag is enabled. Never raises."""
-        try:
-            from manor.feature_flags import is_enabled
-            return is_enabled(feature_flag, properties={"service_env": _get_service_env()})
-        except ImportError:
+        if _flag_is_enabled is None:
             # Feature flags module not available, assume disabled (safe default)
             return False
+        try:
+            return _flag_is_enabled(feature_flag, properties={"service_env": _get_service_env()})
         except Exception:
             # Error checking flag, assume disabled for safety
             return False
 
+    def _encode_jwt(self, config, now, exp):
+        """
+        Encode and sign an HS256 JWT for the configured claims.
+
+        Only iat/exp change between refreshes. The JSON for iss/aud/sub and
+        the keyed HMAC are built once and reused until the secret or one of
+        those claims changes, so a refresh only formats two integers and
+        signs. The output is byte-for-byte what jwt.encode() produces.
+        """
+        signing_config = (
+            config["secret"],
+            config["issuer"],
+            config["audience"],
+            config["subject"],
+        )
+        cached_config, payload_prefix, hmac_template = self._signing_cache
+        if cached_config != signing_config:
+            secret, issuer, audience, subject = signing_config
+            # '{"iss":...,"aud":...,"sub":...' without the closing brace
+            payload_prefix = json.dumps(
+                {"iss": issuer, "aud": audience, "sub": subject},
+                separators=(",", ":"),
+            ).encode()[:-1]
+            hmac_template = hmac.new(secret.encode(), None, hashlib.sha256)
+            self._signing_cache = (signing_config, payload_prefix, hmac_template)
+
+        payload = b'%s,"iat":%d,"exp":%d}' % (payload_prefix, now, exp)
+        signing_input = _JWT_HEADER_B64 + b"." + _b64url(payload)
+        signer = hmac_template.copy()
+        signer.update(signing_input)
+        signature = signer.digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
     def _generate_token(self, config):
         """Generate a new JWT token. Never raises."""
-        if not self._jwt_available or jwt is None:
-            self._log("warning", "mcp_token_jwt_not_available")
-            return None
-
         try:
+            # Wall clock for the claims, monotonic clock for the local expiry
             now = int(time.time())
             exp = now + config["ttl_seconds"]
+            exp_monotonic = time.monotonic() + config["ttl_seconds"]
 
-            payload = {
-                "iss": config["issuer"],
-                "aud": config["audience"],
-                "sub": config["subject"],
-                "iat": now,
-                "exp": exp,
-            }
-
-            token = jwt.encode(payload, config["secret"], algorithm=self._algorithm)
+            token = self._encode_jwt(config, now, exp)
 
-            self._token = token
-            self._token_exp = exp
+            self._token_state = (token, exp_monotonic, "Bearer " + token)
 
             self._log(
                 "info",
@@ -164,32 +232,39 @@ class MCPTokenProvider:
             return None
 
     def _get_token(self):
-        """Get a valid token, generating a new one if needed. Never raises."""
-        try:
-            config = self._get_config()
+        """
+        Get a valid token, generating a new one if needed.
+
+        Not guarded itself: _get_config, _is_feature_enabled and
+        _generate_token never raise, and get_token() catches anything else.
+        """
+        # Recently found disabled: skip the config and feature flag checks
+        if time.monotonic() < self._disabled_until_monotonic:
+            return None
 
-            # Check feature flag first
-            if not self._is_feature_enabled(config["feature_flag"]):
-                return None
+        config = self._get_config()
 
-            # Check if secret is configured
-            if not config["secret"]:
-                return None
+        # Check feature flag first, then if secret is configured. A negative
+        # verdict is reused for disabled_cache_seconds.
+        if not self._is_feature_enabled(config["feature_flag"]) or not config["secret"]:
+            self._disabled_until_monotonic = time.monotonic() + config["disabled_cache_seconds"]
+            return None
 
-            # Thread-safe token generation
-            with self._token_lock:
-                now = int(time.time())
-                margin = config["margin_seconds"]
+        # Fast path: cached token still valid, no lock needed
+        margin = config["margin_seconds"]
+        token, exp_monotonic, _ = self._token_state
+        if token and time.monotonic() < exp_monotonic - margin:
+            return token
 
-                # Return cached token if still valid
-                if self._token and now < (self._token_exp - margin):
-                    return self._token
+        # Thread-safe token generation
+        with self._token_lock:
+            # Another thread may have refreshed while we waited
+            token, exp_monotonic, _ = self._token_state
+            if token and time.monotonic() < exp_monotonic - margin:
+                return token
 
-                # Generate new token
-                return self._generate_token(config)
-        except Exception as e:
-            self._log("error", "mcp_token_get_failed", error=str(e))
-            return None
+            # Generate new token
+            return self._generate_token(config)
 
     @classmethod
     def get_token(cls):
@@ -199,7 +274,8 @@ class MCPTokenProvider:
             if instance is None:
                 return None
             return instance._get_token()
-        except Exception:
+        except Exception as e:
+            cls._log("error", "mcp_token_get_failed", error=str(e))
             return None
 
     @classmethod
@@ -207,45 +283,45 @@ class MCPTokenProvider:
         """Get authentication headers for MCP requests. Never raises."""
         try:
             token = cls.get_token()
-            if token:
-                return {"Authorization": f"Bearer {token}"}
-            return {}
+            if not token:
+                return {}
+
+            # Reuse the header value built with the token, unless the token
+            # was refreshed in between. A new dict each time, since callers
+            # commonly add their own headers to it.
+            instance = cls._instance
+            if instance is not None:
+                cached_token, _, authorization = instance._token_state
+                if cached_token is token:
+                    return {"Authorization": authorization}
+            return {"Authorization": f"Bearer {token}"}
         except Exception:
             return {}
 
     @staticmethod
     def _log(level, message, **kwargs):
         """Log a message using manor.logger if available. Never raises."""
-        try:
-            from manor.logger import logger
-            log_method = getattr(logger, level, logger.info)
-            log_method(message, **kwargs)
-        except Exception:
+        if _logger is not None:
             try:
-                import json
-                log_data = {"level": level, "msg": message, **kwargs}
-                sys.stderr.write(json.dumps(log_data) + "\n")
-                sys.stderr.flush()
+                log_method = getattr(_logger, level, _logger.info)
+                log_method(message, **kwargs)
+                return
             except Exception:
-                pass  # Silently ignore if even stderr fails
+                pass
+        try:
+            log_data = {"level": level, "msg": message, **kwargs}
+            sys.stderr.write(json.dumps(log_data) + "\n")
+            sys.stderr.flush()
+        except Exception:
+            pass  # Silently ignore if even stderr fails
 
 
 # Convenience functions - all designed to NEVER raise exceptions
 
-def get_token():
-    """Get a valid MCP authentication token. Never raises, returns None on any error."""
-    try:
-        return MCPTokenProvider.get_token()
-    except Exception:
-        return None
-
-
-def get_auth_headers():
-    """Get authentication headers for MCP requests. Never raises, returns {} on any error."""
-    try:
-        return MCPTokenProvider.get_auth_headers()
-    except Exception:
-        return {}
+# The class methods already catch everything, so they are exported as they
+# are rather than through wrapper functions
+get_token = MCPTokenProvider.get_token
+get_auth_headers = MCPTokenProvider.get_auth_headers
 
 
 def is_enabled():
@@ -236,6 +236,25 @@ class TestPostHogClientMethods:
         finally:
             client_module.POSTHOG_API_KEY = original_key
 
+    def test_feature_enabled_is_cached(self, mock_posthog):
+        """Test repeated feature_enabled calls are served from the TTL cache."""
+        from manor.feature_flags import PostHogClient
+        import manor.feature_flags.client as client_module
+        
+        original_key = client_module.POSTHOG_API_KEY
+        client_module.POSTHOG_API_KEY = "test-api-key"
+        
+        try:
+            client = PostHogClient.get_instance()
+            
+            for _ in range(3):
+                assert client.feature_enabled("test-flag", "user-123") is True
+            client.feature_enabled("test-flag", "user-456")
+            
+            assert mock_posthog.feature_enabled.call_count == 2
+        finally:
+            client_module.POSTHOG_API_KEY = original_key
+
     def test_get_feature_flag(self, mock_posthog):
         """Test get_feature_flag method for multivariate flags."""
         from manor.feature_flags import PostHogClient
@@ -320,6 +339,41 @@ class TestFeatureFlagChecker:
         finally:
             client_module.POSTHOG_API_KEY = original_key
 
+    def test_service_flags_served_from_snapshot(self, mock_posthog):
+        """Test service-level checks without local evaluation use one get_all_flags call."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+        
+        original_key = client_module.POSTHOG_API_KEY
+        client_module.POSTHOG_API_KEY = "test-api-key"
+        
+        try:
+            with patch.object(client_module, "POSTHOG_PERSONAL_API_KEY", ""):
+                for _ in range(3):
+                    assert FeatureFlagChecker.is_flag_enabled("flag1") is True
+                assert FeatureFlagChecker.get_flag_value("flag2") == "variant-b"
+            
+            assert mock_posthog.get_all_flags.call_count == 1
+            assert not mock_posthog.feature_enabled.called
+            assert not mock_posthog.get_feature_flag.called
+        finally:
+            client_module.POSTHOG_API_KEY = original_key
+
+    def test_static_override_skips_posthog(self, mock_posthog):
+        """Test POSTHOG_FLAG_OVERRIDES values are returned without calling PostHog."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+        
+        overrides = client_module._parse_flag_overrides("kill-switch=false, layout=v2,bad")
+        assert overrides == {"kill-switch": False, "layout": "v2"}
+        
+        with patch.object(client_module, "_STATIC_OVERRIDES", overrides):
+            assert FeatureFlagChecker.is_flag_enabled("kill-switch") is False
+            assert FeatureFlagChecker.get_flag_value("layout", user_id="user-123") == "v2"
+        
+        assert not mock_posthog.feature_enabled.called
+        assert not mock_posthog.get_feature_flag.called
+
     def test_is_flag_enabled_with_user_id(self, mock_posthog):
         """Test is_flag_enabled with user_id."""
         from manor.feature_flags import FeatureFlagChecker
@@ -346,6 +400,17 @@ class TestFeatureFlagChecker:
         finally:
             client_module.POSTHOG_API_KEY = original_key
 
+    def test_merged_properties_keep_each_callers_values(self):
+        """Test equal-comparing properties of different types are not conflated."""
+        from manor.feature_flags.client import _merge_properties
+
+        first = _merge_properties({"plan": 1})
+        second = _merge_properties({"plan": True})
+
+        assert type(first["plan"]) is int
+        assert second["plan"] is True
+        assert second is not first
+
     def test_is_flag_enabled_with_properties(self, mock_posthog):
         """Test is_flag_enabled with properties."""
         from manor.feature_flags import FeatureFlagChecker
@@ -434,6 +499,78 @@ class TestFeatureFlagChecker:
         finally:
             client_module.POSTHOG_API_KEY = original_key
 
+    def test_prime_request_serves_checks_from_snapshot(self, mock_posthog):
+        """Test checks after prime_request use the get_all_flags snapshot."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+
+        original_key = client_module.POSTHOG_API_KEY
+        client_module.POSTHOG_API_KEY = "test-api-key"
+
+        try:
+            token = FeatureFlagChecker.prime_request(user_id="user-123")
+            try:
+                assert FeatureFlagChecker.is_flag_enabled("flag1", user_id="user-123") is True
+                assert FeatureFlagChecker.get_flag_value("flag2", user_id="user-123") == "variant-b"
+                assert not mock_posthog.feature_enabled.called
+                assert not mock_posthog.get_feature_flag.called
+
+                # Other users are not covered by the snapshot
+                FeatureFlagChecker.is_flag_enabled("flag1", user_id="user-456")
+                assert mock_posthog.feature_enabled.called
+            finally:
+                FeatureFlagChecker.reset_request(token)
+
+            assert mock_posthog.get_all_flags.call_count == 1
+        finally:
+            client_module.POSTHOG_API_KEY = original_key
+
+    def test_prime_request_matches_explicit_service_env(self, mock_posthog):
+        """Test a snapshot primed without properties serves service_env checks."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+
+        with patch.object(client_module, "POSTHOG_API_KEY", "test-api-key"):
+            token = FeatureFlagChecker.prime_request()
+            try:
+                # The mcp_auth call pattern: a fresh service_env dict per check
+                properties = {"service_env": client_module._SERVICE_ENV}
+                assert FeatureFlagChecker.is_flag_enabled("flag1", properties=properties)
+                assert not mock_posthog.feature_enabled.called
+
+                FeatureFlagChecker.is_flag_enabled("flag1", properties={"plan": "pro"})
+                assert mock_posthog.feature_enabled.called
+            finally:
+                FeatureFlagChecker.reset_request(token)
+
+    def test_prime_request_local_only_skips_remote_evaluation(self, mock_posthog):
+        """Test local_only does not prime when flags would need a request to PostHog."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+
+        with (
+            patch.object(client_module, "POSTHOG_API_KEY", "test-api-key"),
+            patch.object(client_module, "POSTHOG_PERSONAL_API_KEY", ""),
+        ):
+            assert FeatureFlagChecker.prime_request(local_only=True) is None
+
+        assert not mock_posthog.get_all_flags.called
+
+    def test_prime_request_local_only_never_falls_back_to_remote(self, mock_posthog):
+        """Test local_only asks the SDK not to fetch flags it can't evaluate locally."""
+        from manor.feature_flags import FeatureFlagChecker
+        import manor.feature_flags.client as client_module
+
+        with (
+            patch.object(client_module, "POSTHOG_API_KEY", "test-api-key"),
+            patch.object(client_module, "POSTHOG_PERSONAL_API_KEY", "test-personal-key"),
+        ):
+            token = FeatureFlagChecker.prime_request(local_only=True)
+            FeatureFlagChecker.reset_request(token)
+
+        assert token is not None
+        assert mock_posthog.get_all_flags.call_args.kwargs["only_evaluate_locally"] is True
+
 
 # =============================================================================
 # TESTS: CONVENIENCE FUNCTIONS
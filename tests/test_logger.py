@@ -86,6 +86,50 @@ class TestBasicLogging:
         
         assert isinstance(logger, LazyLoggerProxy)
 
+    def test_logger_accepts_values_orjson_rejects(self, capsys):
+        """Test ints over 64 bits and lone surrogates are still logged."""
+        from manor.logger import configure_logging
+        
+        logger = configure_logging(service="test-service", env="cicd")
+        logger.info("Big number", n=2**70)
+        logger.info("Odd path", path="bad\udcff.txt")
+        
+        time.sleep(0.1)
+        
+        captured = capsys.readouterr()
+        assert str(2**70) in captured.out
+        assert "bad\\udcff.txt" in captured.out
+
+    def test_configure_logging_replaces_existing_root_handlers(self):
+        """Test configuration installs the queue handler even if root has handlers."""
+        from logging.handlers import QueueHandler
+        from manor.logger import configure_logging
+        
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        root_logger.addHandler(logging.NullHandler())
+        try:
+            configure_logging(service="test-service", env="cicd")
+            
+            assert len(root_logger.handlers) == 1
+            assert isinstance(root_logger.handlers[0], QueueHandler)
+        finally:
+            root_logger.handlers[:] = original_handlers
+
+    def test_proxy_caches_attributes_until_reconfigured(self):
+        """Test the proxy caches resolved methods and drops them on reconfigure."""
+        import manor.logger.structured_logger as sl
+        
+        sl.configure_logging(service="test-service", env="cicd")
+        
+        info = sl.logger.info
+        assert sl.logger.__dict__["info"] is info
+        
+        sl._is_configured = False
+        sl._logger_instance = None
+        sl.configure_logging(service="test-service", env="cicd")
+        assert "info" not in sl.logger.__dict__
+
     def test_configure_logging_returns_logger(self):
         """Test that configure_logging returns a structlog logger."""
         from manor.logger import configure_logging
@@ -182,6 +226,18 @@ class TestRequestContext:
         # Should be unique
         assert id1 != id2
 
+    def test_generate_request_id_is_valid_uuid4(self):
+        """Test generated request IDs round-trip as RFC 4122 version 4 UUIDs."""
+        import uuid
+        from manor.logger.context import generate_request_id
+
+        for _ in range(100):
+            request_id = generate_request_id()
+            parsed = uuid.UUID(request_id)
+            assert str(parsed) == request_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
     def test_extra_context(self):
         """Test extra context functionality."""
         from manor.logger.context import (
@@ -228,6 +284,25 @@ class TestRequestContext:
         # Should be cleared after exiting
         assert get_request_id() is None
 
+    def test_with_request_context_restores_outer_context(self):
+        """Test nested with_request_context restores the outer request ID."""
+        from manor.logger.context import (
+            get_extra_context,
+            get_request_id,
+            set_extra_context,
+            with_request_context,
+        )
+
+        with with_request_context("outer-id"):
+            with with_request_context("inner-id"):
+                set_extra_context(job="inner")
+                assert get_request_id() == "inner-id"
+
+            assert get_request_id() == "outer-id"
+            assert get_extra_context() == {}
+
+        assert get_request_id() is None
+
     @pytest.mark.asyncio
     async def test_with_request_context_async(self):
         """Test with_request_context as async context manager."""
@@ -454,6 +529,38 @@ class TestRequestContextMiddleware:
         assert captured_request_id is not None
         assert len(captured_request_id) == 36  # UUID format
 
+    @pytest.mark.asyncio
+    async def test_middleware_header_priority(self):
+        """Test X-Request-ID wins over X-Correlation-ID regardless of order."""
+        from manor.logger.context import RequestContextMiddleware, get_request_id
+
+        captured = []
+
+        async def mock_app(scope, receive, send):
+            captured.append(get_request_id())
+
+        middleware = RequestContextMiddleware(mock_app)
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            pass
+
+        await middleware({
+            "type": "http",
+            "headers": [
+                (b"x-correlation-id", b"corr-1"),
+                (b"x-request-id", b"req-1"),
+            ],
+        }, receive, send)
+        await middleware({
+            "type": "http",
+            "headers": [(b"x-request-id", b""), (b"x-correlation-id", b"corr-2")],
+        }, receive, send)
+
+        assert captured == ["req-1", "corr-2"]
+
     @pytest.mark.asyncio
     async def test_middleware_clears_context_after_request(self):
         """Test middleware clears context after request completes."""
@@ -613,12 +720,181 @@ class TestDatadogHandler:
         
         # Should have called post
         assert mock_httpx_client.post.called
-        
+
         # Cleanup
         handler.close()
 
+    def test_handler_close_sends_pending_logs(self, datadog_api_key, mock_httpx_client):
+        """Test close() delivers a partial batch before returning."""
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+            batch_size=100,
+        )
+        for i in range(3):
+            handler.emit(logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=1,
+                msg=json.dumps({"msg": f"Test message {i}"}),
+                args=(),
+                exc_info=None,
+            ))
+
+        handler.close()
+
+        assert mock_httpx_client.post.call_count == 1
+        assert not handler._sender_thread.is_alive()
+
+    def test_handler_retries_rate_limited_batch(self, datadog_api_key, mock_httpx_client):
+        """Test a 429 is retried after Retry-After and a 400 is not."""
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        mock_httpx_client.post.side_effect = [
+            MagicMock(status_code=429, headers={"Retry-After": "0"}),
+            MagicMock(status_code=202),
+            MagicMock(status_code=400, text="bad request"),
+        ]
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+        )
+        try:
+            handler._post_logs([{"message": "first"}])
+            assert mock_httpx_client.post.call_count == 2
+            assert handler._consecutive_errors == 0
+
+            with patch("sys.stderr"):
+                handler._post_logs([{"message": "second"}])
+            assert mock_httpx_client.post.call_count == 3
+            assert handler._consecutive_errors == 1
+        finally:
+            mock_httpx_client.post.side_effect = None
+            handler.close()
+
+    def test_handler_posts_values_orjson_rejects(self, datadog_api_key, mock_httpx_client):
+        """Test a big int or lone surrogate in one entry doesn't lose the batch."""
+        import gzip
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+        )
+        try:
+            handler._post_logs([
+                {"message": "first", "n": 2**70},
+                {"message": "second", "path": "bad\udcff.txt"},
+            ])
+
+            call = mock_httpx_client.post.call_args
+            payload = json.loads(gzip.decompress(call.kwargs["content"]))
+            assert payload[0]["n"] == 2**70
+            assert payload[1]["path"] == "bad\udcff.txt"
+        finally:
+            handler.close()
+
+    def test_handler_posts_gzipped_batch(self, datadog_api_key, mock_httpx_client):
+        """Test batches are posted as gzip-compressed JSON."""
+        import gzip
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+            batch_size=100,
+        )
+        for i in range(2):
+            handler.emit(logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=1,
+                msg=json.dumps({"msg": f"Test message {i}"}),
+                args=(),
+                exc_info=None,
+            ))
+        handler.close()
+
+        call = mock_httpx_client.post.call_args
+        assert call.kwargs["headers"] == {"Content-Encoding": "gzip"}
+        payload = json.loads(gzip.decompress(call.kwargs["content"]))
+        assert [entry["message"] for entry in payload] == ["Test message 0", "Test message 1"]
+
+    def test_handler_drops_oldest_pending_logs(self, datadog_api_key, mock_httpx_client):
+        """Test a full pending buffer evicts the oldest logs and reports the count."""
+        import gzip
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+            batch_size=100,
+            max_pending_logs=2,
+        )
+        for i in range(5):
+            handler.emit(logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=1,
+                msg=json.dumps({"msg": f"Test message {i}"}),
+                args=(),
+                exc_info=None,
+            ))
+        handler.close()
+
+        messages = [
+            entry["message"]
+            for call in mock_httpx_client.post.call_args_list
+            for entry in json.loads(gzip.decompress(call.kwargs["content"]))
+        ]
+        assert messages == [
+            "Test message 3",
+            "Test message 4",
+            "Dropped 3 logs: Datadog log buffer full",
+        ]
+
+    def test_handler_ignores_own_http_client_logs(self, datadog_api_key, mock_httpx_client):
+        """Test httpx/httpcore records never reach the Datadog batch."""
+        from manor.logger.structured_logger import DatadogHttpHandler
+
+        handler = DatadogHttpHandler(
+            api_key=datadog_api_key,
+            service="test-service",
+            env="cicd",
+            site="us5.datadoghq.com",
+            batch_size=100,
+        )
+        for name in ("httpx", "httpcore.connection", "app"):
+            handler.handle(logging.LogRecord(
+                name=name,
+                level=logging.WARNING,
+                pathname="test.py",
+                lineno=1,
+                msg="message",
+                args=(),
+                exc_info=None,
+            ))
+
+        assert [entry["logger"]["name"] for entry in handler._pending_logs] == ["app"]
+        handler.close()
+
     def test_handler_fork_safety(self, datadog_api_key):
-        """Test handler detects PID change (simulated fork)."""
+        """Test the at-fork reset gives the handler a new client and threads."""
         from manor.logger.structured_logger import DatadogHttpHandler
         
         handler = DatadogHttpHandler(
@@ -631,14 +907,18 @@ class TestDatadogHandler:
         # Get initial client
         client1 = handler._get_http_client()
         
-        # Simulate fork by changing stored PID
-        handler._process_id = 99999
+        sender_thread = handler._sender_thread
+        
+        # Simulate fork by running the hook registered for forked children
+        handler._reset_after_fork()
         
         # Get client again - should create new one
         client2 = handler._get_http_client()
         
-        # Should be different clients
+        # Should be different clients, and new background threads
         assert client1 is not client2
+        assert handler._sender_thread is not sender_thread
+        assert handler._sender_thread.is_alive()
         
         # Cleanup
         handler.close()
@@ -692,6 +972,217 @@ class TestHealthCheckFilter:
         # Should be allowed
         assert filter.filter(record) is True
 
+    def test_filter_checks_args_without_formatting(self):
+        """Test filter matches /health in uvicorn-style args without formatting."""
+        from manor.logger.structured_logger import HealthCheckLogFilter
+        
+        filter = HealthCheckLogFilter()
+        
+        record = logging.LogRecord(
+            name="uvicorn.access",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg='%s - "%s %s HTTP/%s" %d',
+            args=("127.0.0.1:5000", "GET", "/health", "1.1", 200),
+            exc_info=None,
+        )
+        
+        with patch.object(record, "getMessage") as get_message:
+            assert filter.filter(record) is False
+            record.args = ("127.0.0.1:5000", "GET", "/api/users", "1.1", 200)
+            assert filter.filter(record) is True
+        
+        assert not get_message.called
+
+
+class TestTraceCorrelation:
+    """Test the cached trace correlation against the installed ddtrace."""
+
+    def test_follows_span_start_and_finish(self):
+        """Test the correlation tracks the active span as spans open and close."""
+        ddtrace = pytest.importorskip("ddtrace")
+        from manor.logger.trace_context import get_log_correlation_context
+
+        with ddtrace.tracer.trace("outer") as outer:
+            assert get_log_correlation_context()["dd.span_id"] == str(outer.span_id)
+            with ddtrace.tracer.trace("inner") as inner:
+                assert get_log_correlation_context()["dd.span_id"] == str(inner.span_id)
+            assert get_log_correlation_context()["dd.span_id"] == str(outer.span_id)
+        assert get_log_correlation_context()["dd.span_id"] == "0"
+
+    def test_span_finished_on_other_thread_is_not_reported(self):
+        """Test a span finished by another thread does not leave a stale span ID."""
+        ddtrace = pytest.importorskip("ddtrace")
+        from manor.logger.trace_context import get_log_correlation_context
+
+        with ddtrace.tracer.trace("outer") as outer:
+            inner = ddtrace.tracer.trace("inner")
+            assert get_log_correlation_context()["dd.span_id"] == str(inner.span_id)
+
+            finisher = threading.Thread(target=inner.finish)
+            finisher.start()
+            finisher.join()
+
+            assert get_log_correlation_context()["dd.span_id"] == str(outer.span_id)
+
+    def test_ddtrace_error_returns_empty(self):
+        """Test a failing ddtrace lookup never escapes into the logging call."""
+        ddtrace = pytest.importorskip("ddtrace")
+        from manor.logger.trace_context import get_log_correlation_context
+
+        with (
+            ddtrace.tracer.trace("task"),
+            patch.object(
+                ddtrace.tracer, "get_log_correlation_context", side_effect=RuntimeError
+            ),
+        ):
+            assert get_log_correlation_context() == {}
+
+
+class TestRingBufferQueue:
+    """Test the log queue between QueueHandler and QueueListener."""
+
+    def test_drops_oldest_when_full(self):
+        """Test put_nowait() never blocks and evicts the oldest record."""
+        from queue import Empty
+        from manor.logger.structured_logger import RingBufferQueue
+
+        log_queue = RingBufferQueue(maxsize=2)
+        for item in range(3):
+            log_queue.put_nowait(item)
+
+        assert log_queue.dropped == 1
+        with patch("sys.stderr"):
+            assert log_queue.get() == 1
+        assert log_queue.get() == 2
+        with pytest.raises(Empty):
+            log_queue.get(block=False)
+
+    def test_get_waits_for_producer(self):
+        """Test a blocking get() wakes up when a record is added."""
+        import threading
+        from manor.logger.structured_logger import RingBufferQueue
+
+        log_queue = RingBufferQueue(maxsize=10)
+        threading.Timer(0.05, log_queue.put_nowait, args=("record",)).start()
+
+        assert log_queue.get(timeout=2.0) == "record"
+
+    def test_reset_after_fork_discards_parent_records(self):
+        """Test a forked child does not re-emit records the parent still holds."""
+        from queue import Empty
+        from manor.logger.structured_logger import RingBufferQueue
+
+        log_queue = RingBufferQueue(maxsize=2)
+        for item in range(3):
+            log_queue.put_nowait(item)
+
+        log_queue._reset_after_fork()
+
+        assert log_queue.dropped == 0
+        with pytest.raises(Empty):
+            log_queue.get(block=False)
+        log_queue.put_nowait("child")
+        assert log_queue.get(timeout=2.0) == "child"
+
+
+# =============================================================================
+# TESTS: DIRECT DATADOG LOGGER
+# =============================================================================
+
+
+class TestDirectDatadogLogger:
+    """Test direct Datadog logger used by workers."""
+
+    def test_log_posts_entry_with_tags(self, mock_httpx_client):
+        """Test log() posts a single entry with service/env/level tags."""
+        from manor.logger.direct_logger import DirectDatadogLogger
+
+        direct_logger = DirectDatadogLogger(
+            service="worker",
+            env="cicd",
+            api_key="test-key",
+        )
+        direct_logger.log("Task started", level="info", task_id="abc-123")
+        direct_logger.flush()
+
+        assert mock_httpx_client.post.called
+        payload = json.loads(mock_httpx_client.post.call_args.kwargs["content"])
+        assert len(payload) == 1
+
+        entry = payload[0]
+        assert entry["message"] == "Task started"
+        assert entry["level"] == "info"
+        assert entry["service"] == "worker"
+        assert entry["ddsource"] == "python"
+        assert entry["task_id"] == "abc-123"
+        assert entry["ddtags"] == "service:worker,env:cicd,level:info,task_id:abc-123"
+        assert isinstance(entry["timestamp"], int)
+
+    def test_log_is_noop_without_api_key(self, mock_httpx_client):
+        """Test log() skips delivery when no API key is configured."""
+        import manor.logger.direct_logger as direct_logger_module
+
+        with patch.object(direct_logger_module, "DD_API_KEY", None):
+            direct_logger = direct_logger_module.DirectDatadogLogger(service="worker")
+
+        assert direct_logger.client is None
+
+        direct_logger.log("first")
+        direct_logger.log("second", level="error", task_id="abc-123")
+
+        assert not mock_httpx_client.post.called
+
+    def test_log_includes_active_span_correlation(self, mock_httpx_client):
+        """Test log() picks up trace correlation for the active span."""
+        ddtrace = pytest.importorskip("ddtrace")
+        from manor.logger.direct_logger import DirectDatadogLogger
+
+        direct_logger = DirectDatadogLogger(service="worker", api_key="test-key")
+
+        with ddtrace.tracer.trace("worker.task") as span:
+            direct_logger.log("inside span")
+        direct_logger.log("outside span")
+        direct_logger.flush()
+
+        inside, outside = (
+            entry
+            for call in mock_httpx_client.post.call_args_list
+            for entry in json.loads(call.kwargs["content"])
+        )
+        assert inside["dd.span_id"] == str(span.span_id)
+        assert outside["dd.span_id"] == "0"
+
+    def test_unserializable_field_does_not_drop_batch(self, mock_httpx_client):
+        """Test one odd field is stringified instead of failing its whole batch."""
+        from manor.logger.direct_logger import DirectDatadogLogger
+
+        direct_logger = DirectDatadogLogger(service="worker", api_key="test-key")
+        direct_logger.log("odd", obj=object(), big=2**70)
+        direct_logger.log("plain")
+        assert direct_logger.flush(timeout=5.0)
+
+        messages = [
+            entry["message"]
+            for call in mock_httpx_client.post.call_args_list
+            for entry in json.loads(call.kwargs["content"])
+        ]
+        assert messages == ["odd", "plain"]
+
+    def test_flush_timeout_returns_while_entries_pending(self, mock_httpx_client):
+        """Test flush(timeout) gives up instead of hanging on a stuck intake."""
+        from manor.logger.direct_logger import DirectDatadogLogger
+
+        release = threading.Event()
+        mock_httpx_client.post.side_effect = lambda *args, **kwargs: release.wait(5.0)
+        direct_logger = DirectDatadogLogger(service="worker", api_key="test-key")
+        direct_logger.log("stuck")
+
+        assert direct_logger.flush(timeout=0.1) is False
+        release.set()
+        assert direct_logger.flush(timeout=5.0)
+
 
 # =============================================================================
 # TESTS: REAL DATADOG INTEGRATION
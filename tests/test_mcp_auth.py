@@ -98,6 +98,20 @@ class TestMCPTokenProvider:
             assert config["subject"] == "test-subject"
             assert config["ttl_seconds"] == 7200
             assert config["margin_seconds"] == 60
+    
+    def test_get_config_is_cached_until_ttl(self):
+        from manor.mcp_auth import MCPTokenProvider
+        
+        with mock.patch.dict(os.environ, {"MCP_AUTH_ISSUER": "first"}, clear=True):
+            instance = MCPTokenProvider.get_instance()
+            assert instance._get_config()["issuer"] == "first"
+            
+            os.environ["MCP_AUTH_ISSUER"] = "second"
+            assert instance._get_config()["issuer"] == "first"
+            
+            # Expire the cached config
+            instance._config_cache = (0.0, instance._config_cache[1])
+            assert instance._get_config()["issuer"] == "second"
 
 
 class TestTokenGeneration:
@@ -187,6 +201,25 @@ class TestFeatureFlagIntegration:
                 token = get_token()
                 assert token is None
     
+    def test_disabled_verdict_is_cached(self):
+        from manor.mcp_auth import MCPTokenProvider
+        
+        env = {"MCP_AUTH_SECRET": "test-secret"}
+        
+        with mock.patch.dict(os.environ, env, clear=True):
+            with mock.patch("manor.mcp_auth.token.MCPTokenProvider._is_feature_enabled") as m:
+                m.return_value = False
+                instance = MCPTokenProvider.get_instance()
+                
+                assert instance._get_token() is None
+                m.return_value = True
+                assert instance._get_token() is None
+                assert m.call_count == 1
+                
+                # Once the verdict expires the flag is checked again
+                instance._disabled_until_monotonic = 0.0
+                assert instance._get_token() is not None
+    
     def test_token_generated_when_flag_enabled(self):
         from manor.mcp_auth import get_token
         
@@ -343,6 +376,54 @@ class TestJWTValidation:
             assert payload["sub"] == "service-application"
             assert payload["exp"] > time.time()
     
+    def test_token_matches_pyjwt_encoding(self):
+        from manor.mcp_auth import MCPTokenProvider
+        
+        config = {
+            "secret": "test-secret",
+            "issuer": "manor-internal",
+            "audience": "service-search-mcp",
+            "subject": "service-\u00e9\"quoted\"",
+        }
+        
+        token = MCPTokenProvider()._encode_jwt(config, 1700000000, 1700003600)
+        
+        assert token == jwt.encode(
+            {
+                "iss": config["issuer"],
+                "aud": config["audience"],
+                "sub": config["subject"],
+                "iat": 1700000000,
+                "exp": 1700003600,
+            },
+            config["secret"],
+            algorithm="HS256",
+        )
+    
+    def test_encoder_picks_up_changed_secret_and_claims(self):
+        from manor.mcp_auth import MCPTokenProvider
+        
+        provider = MCPTokenProvider()
+        config = {
+            "secret": "first-secret",
+            "issuer": "manor-internal",
+            "audience": "service-search-mcp",
+            "subject": "service-a",
+        }
+        provider._encode_jwt(config, 1700000000, 1700003600)
+        
+        config = {**config, "secret": "second-secret", "subject": "service-b"}
+        token = provider._encode_jwt(config, 1700000000, 1700003600)
+        
+        payload = jwt.decode(
+            token,
+            "second-secret",
+            algorithms=["HS256"],
+            audience="service-search-mcp",
+            options={"verify_exp": False},
+        )
+        assert payload["sub"] == "service-b"
+    
     def test_wrong_secret_is_rejected(self, mock_feature_flag):
         from manor.mcp_auth import get_token
         
@@ -422,7 +503,9 @@ class TestNeverRaises:
         env = {"MCP_AUTH_SECRET": "test-secret"}
         
         with mock.patch.dict(os.environ, env, clear=True):
-            with mock.patch("jwt.encode", side_effect=Exception("JWT error")):
+            with mock.patch.object(
+                MCPTokenProvider, "_encode_jwt", side_effect=Exception("JWT error")
+            ):
                 # Reset singleton to force re-init
                 MCPTokenProvider._instance = None
                 result = get_token()